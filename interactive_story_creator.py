@@ -4,13 +4,12 @@ Interactive Story Creator - Easy way to create custom stories with main.py
 
 import asyncio
 import os
-from pathlib import Path
 from story_engine.core.models import StoryConcept
 
-# Create logs directory before importing main
-Path('logs').mkdir(exist_ok=True)
+from main import StoryEngineApp, setup_logging
 
-from main import StoryEngineApp
+# API keys that must be set before creating a story
+REQUIRED_API_KEYS = ('OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'GOOGLE_API_KEY')
 
 def get_user_input(prompt, default=None):
     """Get user input with optional default value."""
@@ -79,7 +78,7 @@ def choose_output_formats():
     print("2. JSON + HTML (interactive viewer)")
     print("3. JSON + HTML + Images (if available)")
     print("4. JSON + HTML + Images + Audio (if available)")
-    print("5. Everything including video (if moviepy available)")
+    print("5. Everything including video (if ffmpeg available)")
     
     choice = get_user_input("Choose (1-5)", "2")
     
@@ -101,8 +100,7 @@ async def main():
     print("=" * 60)
     
     # Check if we have API keys
-    required_keys = ['OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'GOOGLE_API_KEY']
-    missing = [k for k in required_keys if not os.getenv(k)]
+    missing = [k for k in REQUIRED_API_KEYS if not os.environ.get(k)]
     
     if missing:
         print(f"❌ Missing API keys: {', '.join(missing)}")
@@ -111,74 +109,88 @@ async def main():
     
     print("✅ API keys found!")
     
+    # Initialize the app once and reuse it for every story
+    print(f"\n🚀 Initializing Story Engine...")
+    app = StoryEngineApp()
+    
     try:
-        # Create story concept
-        concept, story_title = create_story_concept()
-        
-        # Choose output formats
-        output_formats = choose_output_formats()
-        
-        # Show summary
-        print(f"\n📋 Story Summary:")
-        print(f"Title: {story_title}")
-        print(f"Genre: {concept.genre}")
-        print(f"Age: {concept.target_age}")
-        print(f"Characters: {len(concept.characters)}")
-        print(f"Output formats: {', '.join(output_formats)}")
-        
-        confirm = get_user_input("\nCreate this story? (y/n)", "y")
-        if confirm.lower() not in ['y', 'yes']:
-            print("Story creation cancelled.")
-            return
-        
-        # Initialize the app
-        print(f"\n🚀 Initializing Story Engine...")
-        app = StoryEngineApp()
-        
-        # Generate the story
-        print(f"\n✨ Generating your story...")
-        result = await app.generate_complete_story(
-            concept=concept,
-            story_title=story_title,
-            output_formats=output_formats
-        )
-        
-        if result['success']:
-            print(f"\n🎉 SUCCESS! Your story has been created!")
-            print(f"📁 Story directory: {result['compilation_result']['story_directory']}")
+        while True:
+            try:
+                # Create story concept
+                concept, story_title = create_story_concept()
             
-            # Show what was created
-            outputs = result['compilation_result']['outputs']
-            print(f"\n📄 Generated files:")
-            for format_type, output_info in outputs.items():
-                if output_info.get('success'):
-                    print(f"  ✅ {format_type.upper()}: {output_info['output_path']}")
-                else:
-                    print(f"  ❌ {format_type.upper()}: {output_info.get('error', 'Failed')}")
+                # Choose output formats
+                output_formats = choose_output_formats()
+            
+                # Show summary
+                print(f"\n📋 Story Summary:")
+                print(f"Title: {story_title}")
+                print(f"Genre: {concept.genre}")
+                print(f"Age: {concept.target_age}")
+                print(f"Characters: {len(concept.characters)}")
+                print(f"Output formats: {', '.join(output_formats)}")
             
-            # Show story preview
-            story = result['story']
-            print(f"\n📖 Story Preview:")
-            print(f"Summary: {story.story_summary}")
-            print(f"Scenes: {len(story.scenes)}")
+                confirm = get_user_input("\nCreate this story? (y/n)", "y")
+                if confirm.lower() not in ['y', 'yes']:
+                    print("Story creation cancelled.")
+                    return
             
-            # Ask if they want to create another
-            another = get_user_input("\nCreate another story? (y/n)", "n")
-            if another.lower() in ['y', 'yes']:
-                await main()  # Recursive call for another story
+                # Generate the story
+                print(f"\n✨ Generating your story...")
+                result = await app.generate_complete_story(
+                    concept=concept,
+                    story_title=story_title,
+                    output_formats=output_formats
+                )
+            
+                if result['success']:
+                    print(f"\n🎉 SUCCESS! Your story has been created!")
+                    print(f"📁 Story directory: {result['compilation_result']['story_directory']}")
+                
+                    # Show what was created
+                    outputs = result['compilation_result']['outputs']
+                    print(f"\n📄 Generated files:")
+                    for format_type, output_info in outputs.items():
+                        if output_info.get('success'):
+                            print(f"  ✅ {format_type.upper()}: {output_info['output_path']}")
+                        else:
+                            print(f"  ❌ {format_type.upper()}: {output_info.get('error', 'Failed')}")
+                
+                    # Show story preview
+                    story = result['story']
+                    print(f"\n📖 Story Preview:")
+                    print(f"Summary: {story.get('story_summary', '')}")
+                    print(f"Scenes: {len(story.get('scenes', []))}")
                 
-        else:
-            print(f"\n❌ Story generation failed: {result.get('error', 'Unknown error')}")
+                    # Ask if they want to create another
+                    another = get_user_input("\nCreate another story? (y/n)", "n")
+                    if another.lower() in ['y', 'yes']:
+                        continue
+                    
+                else:
+                    print(f"\n❌ Story generation failed: {result.get('error', 'Unknown error')}")
+                
+            except KeyboardInterrupt:
+                print(f"\n⚠️ Story creation interrupted by user")
+            except Exception as e:
+                print(f"\n💥 Unexpected error: {e}")
+                print("This might be a dependency or API issue.")
             
-    except KeyboardInterrupt:
-        print(f"\n⚠️ Story creation interrupted by user")
-    except Exception as e:
-        print(f"\n💥 Unexpected error: {e}")
-        print("This might be a dependency or API issue.")
+            break
+    finally:
+        await app.aclose()
 
 if __name__ == "__main__":
     # Load environment variables
     from dotenv import load_dotenv
     load_dotenv()
+    setup_logging()
+    
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        # uvloop not available - using the default event loop
+        pass
     
     asyncio.run(main())
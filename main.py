@@ -7,39 +7,234 @@ It demonstrates the core functionality without proprietary techniques.
 """
 
 import asyncio
+import atexit
+import json
 import logging
+import os
+import queue
+import re
+from functools import cached_property
+from html import escape
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, Any, List
-
-# Ensure logs directory exists
-Path('logs').mkdir(exist_ok=True)
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/story_engine.log'),
-        logging.StreamHandler()
-    ]
-)
+from types import MappingProxyType
+from typing import Any, Collection, Dict, Iterator, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Import public versions
-from story_engine.core.models import StoryConcept, GeneratedStory, AssetGenerationStatus, StoryScene
+from story_engine.core.models import StoryConcept, GeneratedStory, AssetGenerationStatus, StoryScene, EmotionalTone
+from story_engine.core.config import load_config
+from story_engine.core.file_utils import atomic_write, atomic_write_bytes, ensure_dir
 from story_engine.core.orchestrator import StoryOrchestrator
+from story_engine.core.story_cache import StoryCache
 
-# Import optional components
 try:
-    from story_engine.generators.image_generator import ImageGenerator
-    from story_engine.generators.audio_generator import AudioGenerator
-    from story_engine.assemblers.story_compiler import StoryCompiler
-    FULL_FEATURES_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Some features not available: {e}")
-    ImageGenerator = AudioGenerator = StoryCompiler = None
-    FULL_FEATURES_AVAILABLE = False
+    import orjson
+except ImportError:
+    # orjson not available - falling back to the standard library encoder
+    orjson = None
+
+# Mapping of common emotional words to EmotionalTone values
+_TONE_MAPPING = MappingProxyType({
+    'curiosity': 'curious',
+    'wonder': 'awe',
+    'anticipation': 'excited',
+    'serenity': 'calm',
+    'warmth': 'tender',
+    'gentleness': 'tender',
+    'enlightening': 'hopeful',
+    'joy': 'joyful',
+    'encouragement': 'hopeful',
+    'enthusiasm': 'excited',
+    'delight': 'joyful',
+    'happiness': 'joyful',
+    'contentment': 'calm',
+    'satisfaction': 'calm',
+    'reflection': 'nostalgic',
+    'pride': 'determined',
+    'amazed': 'awe',
+    'enchanted': 'mysterious',
+    'welcoming': 'tender',
+    'grateful': 'tender',
+    'content': 'calm',
+    'enlightened': 'hopeful',
+    'reflective': 'nostalgic',
+    'fulfilled': 'joyful',
+    'intrigued': 'curious',
+    'trusting': 'tender',
+    'enthusiastic': 'excited',
+    'reassuring': 'calm',
+    'peaceful': 'calm',
+    'enchanting': 'mysterious'
+})
+
+# Tones that are already valid EmotionalTone values
+_VALID_TONES = frozenset(tone.value for tone in EmotionalTone)
+
+# Character patterns ("Luna the ...", "Luna wearing ...") fused into a single
+# alternation so the story text is scanned once. The pattern runs over
+# lowercased text; matches are sliced back out of the original text.
+_CHARACTER_PATTERN_SOURCE = (
+    r'(\w+)\s+(?:the|is a|was a|named|called|with|wearing|wears|having|'
+    r'who|that|has|had|in)\s+([^,\.]+)'
+)
+_CHARACTER_PATTERN = re.compile(_CHARACTER_PATTERN_SOURCE)
+_CHARACTER_PATTERN_IGNORECASE = re.compile(_CHARACTER_PATTERN_SOURCE, re.IGNORECASE)
+
+# Shortest text that can match, e.g. "Ann in a"
+_MIN_CHARACTER_TEXT_LENGTH = 8
+_WHITESPACE = re.compile(r'\s+')
+
+# Output formats used when none are requested
+_DEFAULT_OUTPUT_FORMATS = ('json',)
+
+# Formats that trigger asset generation rather than a compiled output
+_ASSET_FORMATS = frozenset({'images', 'audio'})
+
+
+def _render_scene_html(scene_number: str, plot_summary: str,
+                       narration_text: str, visual_description: str) -> str:
+    """Render a single scene block of the basic viewer from already-escaped fields."""
+    return f"""
+            <div class="scene">
+                <div class="scene-number">Scene {scene_number}</div>
+                <div class="plot-summary">{plot_summary}</div>
+                <div class="narration">{narration_text}</div>
+                <div class="visual-description">
+                    <strong>Visual:</strong> {visual_description}
+                </div>
+            </div>
+            """
+
+
+def _render_basic_html_head(title: str) -> str:
+    """Render the start of the basic viewer page up to its stylesheet from an escaped title."""
+    return f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+"""
+
+
+# Static stylesheet of the basic viewer, encoded once
+_BASIC_HTML_STYLE = b"""        body {
+            font-family: 'Georgia', serif;
+            line-height: 1.6;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: #333;
+        }
+        .container {
+            background: white;
+            padding: 30px;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+        }
+        h1 {
+            text-align: center;
+            color: #4a5568;
+            margin-bottom: 30px;
+        }
+        .scene {
+            margin-bottom: 40px;
+            padding: 20px;
+            border-left: 4px solid #667eea;
+            background: #f7fafc;
+        }
+        .scene-number {
+            font-weight: bold;
+            color: #667eea;
+            font-size: 1.2em;
+        }
+        .plot-summary {
+            font-style: italic;
+            color: #666;
+            margin-bottom: 15px;
+        }
+        .narration {
+            font-size: 1.1em;
+            margin-bottom: 15px;
+        }
+        .visual-description {
+            background: #e2e8f0;
+            padding: 15px;
+            border-radius: 8px;
+            font-size: 0.9em;
+            color: #4a5568;
+        }
+"""
+
+
+def _render_basic_html_intro(title: str, story_summary: str) -> str:
+    """Render the page heading and summary from already-escaped fields."""
+    return f"""    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>{title}</h1>
+        <div class="story-summary">
+            <p><strong>Summary:</strong> {story_summary}</p>
+        </div>
+        
+        """
+
+
+_BASIC_HTML_FOOTER = b"""
+    </div>
+</body>
+</html>
+        """
+
+
+def setup_logging(log_dir: str = 'logs') -> None:
+    """Configure console and file logging for the command-line entry points.
+    
+    Records are handed to a background listener thread through a queue,
+    so logging calls on the event loop never wait on disk or terminal I/O.
+    """
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+    
+    log_path = ensure_dir(log_dir)
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler(log_path / 'story_engine.log', delay=True),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented UTF-8 JSON.
+    
+    orjson produces the whole document as a single bytes buffer; the
+    standard library fallback streams encoder chunks straight to the file
+    instead of building the full string first.
+    """
+    if orjson:
+        atomic_write_bytes(path, orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    atomic_write(path, (chunk.encode('utf-8') for chunk in encoder.iterencode(data)))
 
 
 class StoryEngineApp:
@@ -47,62 +242,133 @@ class StoryEngineApp:
     
     def __init__(self, config_path: str = "config.yaml"):
         self.config_path = config_path
+        self.config = self._load_config(config_path)
         self.orchestrator = StoryOrchestrator(config_path)
         
-        # Initialize optional components
-        self.image_generator = None
-        self.audio_generator = None
-        self.story_compiler = None
+        # Opt-in persistent cache of generated stories (NO_STORY_CACHE overrides it)
+        self.story_cache = None
+        cache_config = self.config.get('story_cache', {})
+        if cache_config.get('enabled', False) and not os.getenv('NO_STORY_CACHE'):
+            self.story_cache = StoryCache.from_config(self.config)
         
-        if FULL_FEATURES_AVAILABLE:
-            try:
-                config = self._load_config(config_path)
-                self.image_generator = ImageGenerator(config)
-                self.audio_generator = AudioGenerator(config)
-                self.story_compiler = StoryCompiler(config)
-                logger.info("Full story engine features initialized")
-            except Exception as e:
-                logger.warning(f"Failed to initialize full features: {e}")
+        # Bound concurrent provider calls to stay under rate limits
+        default_limit = self.config.get('performance', {}).get('max_concurrent_generations', 3)
+        self._story_semaphore = asyncio.Semaphore(
+            int(os.getenv('STORY_ENGINE_MAX_PARALLEL', default_limit))
+        )
+        self._audio_semaphore = asyncio.Semaphore(
+            self.config.get('audio_generation', {}).get('max_concurrent', default_limit)
+        )
+    
+    # Optional components are imported and initialized on first use, so
+    # JSON-only runs never load the media generation stack
+    
+    @cached_property
+    def image_generator(self):
+        """Image generator, or None if image generation is unavailable."""
+        try:
+            from story_engine.generators.image_generator import ImageGenerator
+            return ImageGenerator(self.config)
+        except Exception as e:
+            logger.warning("Image generation not available: %s", e)
+            return None
+    
+    @cached_property
+    def audio_generator(self):
+        """Audio generator, or None if audio generation is unavailable."""
+        try:
+            from story_engine.generators.audio_generator import AudioGenerator
+            return AudioGenerator(self.config)
+        except Exception as e:
+            logger.warning("Audio generation not available: %s", e)
+            return None
+    
+    @cached_property
+    def story_compiler(self):
+        """Story compiler, or None if compilation is unavailable."""
+        try:
+            from story_engine.assemblers.story_compiler import StoryCompiler
+            return StoryCompiler(self.config)
+        except Exception as e:
+            logger.warning("Story compilation not available: %s", e)
+            return None
         
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file."""
-        try:
-            with open(config_path, 'r') as f:
-                import yaml
-                return yaml.safe_load(f)
-        except FileNotFoundError:
-            return {}
+        return load_config(config_path)
         
     async def generate_story(self, concept: StoryConcept, 
-                           complexity: str = "standard") -> Dict[str, Any]:
-        """Generate a story using the public engine."""
+                           complexity: str = "standard",
+                           cache: str = "exact") -> Dict[str, Any]:
+        """Generate a story using the public engine.
         
-        logger.info(f"Generating story: {concept.genre or 'Untitled'}")
+        Pass cache="off" to skip the story cache and always call the LLM.
+        """
+        
+        logger.info("Generating story: %s", concept.genre or 'Untitled')
+        use_cache = self.story_cache is not None and cache != "off"
         
         try:
-            result = await self.orchestrator.generate_story(concept, complexity)
+            if use_cache:
+                cached_story = await self.story_cache.get(concept, complexity)
+                if cached_story:
+                    logger.info("Story loaded from cache")
+                    return {
+                        'success': True,
+                        'error': None,
+                        'story': cached_story
+                    }
+            
+            async with self._story_semaphore:
+                result = await self.orchestrator.generate_story(concept, complexity)
             
             if result['success']:
                 logger.info("Story generated successfully")
+                if use_cache and self._is_cacheable(result['story']):
+                    await self.story_cache.set(concept, complexity, result['story'])
                 return result
             else:
-                logger.error(f"Story generation failed: {result['error']}")
+                logger.error("Story generation failed: %s", result['error'])
                 return result
                 
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             return {
                 'success': False,
                 'error': str(e),
                 'story': None
             }
     
+    async def generate_stories(self, concepts: List[StoryConcept],
+                             complexity: str = "standard") -> List[Dict[str, Any]]:
+        """Generate several stories concurrently.
+        
+        Each concept goes through the story cache; LLM calls are bounded by
+        STORY_ENGINE_MAX_PARALLEL (default performance.max_concurrent_generations).
+        Results are returned in the same order as the concepts, each with
+        the same shape as a generate_story result.
+        """
+        logger.info("Generating %d stories", len(concepts))
+        return list(await asyncio.gather(
+            *(self.generate_story(concept, complexity) for concept in concepts)
+        ))
+    
+    async def aclose(self) -> None:
+        """Release network resources held by the engine."""
+        await self.orchestrator.aclose()
+        
+        # Only close generators that were actually created
+        for name in ('image_generator', 'audio_generator'):
+            generator = self.__dict__.get(name)
+            if generator is not None:
+                await generator.aclose()
+    
     async def generate_complete_story(self, concept: StoryConcept,
                                     story_title: str,
-                                    output_formats: List[str] = ['json']) -> Dict[str, Any]:
+                                    output_formats: Optional[Sequence[str]] = None) -> Dict[str, Any]:
         """Generate a complete story with specified output formats."""
         
-        logger.info(f"Generating complete story: {story_title}")
+        logger.info("Generating complete story: %s", story_title)
         
         # Generate story structure
         story_result = await self.generate_story(concept)
@@ -110,41 +376,67 @@ class StoryEngineApp:
         if not story_result['success']:
             return story_result
         
-        story = story_result['story']
+        return await self.compile_outputs(story_result['story'], story_title, output_formats)
+    
+    async def compile_outputs(self, story: Dict[str, Any], story_title: str,
+                              output_formats: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Generate assets and output files for an already generated story.
+        
+        Lets one story be rendered into several format sets without another
+        LLM call; the result has the same shape as generate_complete_story.
+        """
+        formats = _DEFAULT_OUTPUT_FORMATS if output_formats is None else tuple(output_formats)
+        requested = frozenset(formats)
+        
+        generate_images = 'images' in requested and self.image_generator
+        generate_audio = 'audio' in requested and self.audio_generator
+        compile_assets = ('images' in requested or 'audio' in requested) and self.story_compiler
         
-        # Initialize asset generation statuses
-        image_statuses = []
-        audio_statuses = []
+        # Normalize and validate scenes once for all asset passes and compilation
+        scenes, invalid_scenes = [], []
+        if generate_images or generate_audio or compile_assets:
+            scenes, invalid_scenes = self._build_scenes(story)
         
-        # Generate images if requested
-        if 'images' in output_formats and self.image_generator:
+        # Generate images and audio concurrently if requested
+        if generate_images:
             logger.info("Generating images...")
-            image_statuses = await self._generate_images(story, story_title)
+            image_task = self._generate_images(story, scenes, story_title)
+        else:
+            image_task = self._no_assets()
         
-        # Generate audio if requested
-        if 'audio' in output_formats and self.audio_generator:
+        if generate_audio:
             logger.info("Generating audio...")
-            audio_statuses = await self._generate_audio(story, story_title)
+            audio_task = self._generate_audio(scenes, story_title)
+        else:
+            audio_task = self._no_assets()
+        
+        image_statuses, audio_statuses = await asyncio.gather(image_task, audio_task)
+        
+        # Scenes that failed validation count as failed assets
+        if invalid_scenes:
+            if generate_images:
+                image_statuses = self._with_failed_scenes(image_statuses, invalid_scenes)
+            if generate_audio:
+                audio_statuses = self._with_failed_scenes(audio_statuses, invalid_scenes)
         
         # Compile final outputs
-        if self.story_compiler and ('images' in output_formats or 'audio' in output_formats):
+        if compile_assets:
             logger.info("Compiling story with assets...")
             
             # Convert story dictionary to GeneratedStory object
             try:
-                # Normalize all scenes first
-                normalized_scenes = []
-                for scene_data in story.get('scenes', []):
-                    normalized_scene_data = self._normalize_emotional_tones(scene_data.copy())
-                    normalized_scenes.append(StoryScene(**normalized_scene_data))
+                if invalid_scenes:
+                    raise ValueError("Invalid story scenes: " + "; ".join(
+                        f"scene {scene_number}: {error}" for scene_number, error in invalid_scenes
+                    ))
                 
                 generated_story = GeneratedStory(
                     story_summary=story.get('story_summary', ''),
-                    scenes=normalized_scenes
+                    scenes=scenes
                 )
                 
                 # Filter out asset generation formats for compilation
-                compilation_formats = [fmt for fmt in output_formats if fmt not in ['images', 'audio']]
+                compilation_formats = [fmt for fmt in formats if fmt not in _ASSET_FORMATS]
                 
                 compilation_result = await self.story_compiler.compile_story(
                     story=generated_story,
@@ -154,7 +446,7 @@ class StoryEngineApp:
                     output_formats=compilation_formats
                 )
             except Exception as e:
-                logger.error(f"Failed to compile story: {e}")
+                logger.error("Failed to compile story: %s", e)
                 compilation_result = {
                     'success': False,
                     'error': str(e),
@@ -176,93 +468,99 @@ class StoryEngineApp:
             return result
         else:
             # Fallback to basic output generation
-            return await self._generate_basic_outputs(story, story_title, output_formats)
+            return await self._generate_basic_outputs(story, story_title, requested)
+    
+    def _build_scenes(self, story: Dict[str, Any]) -> Tuple[List[StoryScene], List[Tuple[Any, str]]]:
+        """Convert raw scene dictionaries into validated StoryScene objects.
+        
+        Returns the valid scenes and a (scene number, error) pair for each
+        scene that failed validation.
+        """
+        scenes, invalid_scenes = [], []
+        for scene_data in story.get('scenes', []):
+            try:
+                scenes.append(StoryScene(**self._normalize_emotional_tones(scene_data)))
+            except Exception as e:
+                scene_number = scene_data.get('scene_number', 'unknown')
+                logger.error("Invalid story scene %s: %s", scene_number, e)
+                invalid_scenes.append((scene_number, str(e)))
+        return scenes, invalid_scenes
+    
+    def _with_failed_scenes(self, statuses: List[AssetGenerationStatus],
+                            invalid_scenes: List[Tuple[Any, str]]) -> List[AssetGenerationStatus]:
+        """Add a failed status for each invalid scene, keeping scene order."""
+        failed = [
+            AssetGenerationStatus(
+                scene_number=scene_number if isinstance(scene_number, int) else 0,
+                error_message=error
+            )
+            for scene_number, error in invalid_scenes
+        ]
+        return sorted(statuses + failed, key=lambda status: status.scene_number)
+    
+    def _is_cacheable(self, story: Dict[str, Any]) -> bool:
+        """Only stories whose scenes all validate are cached."""
+        try:
+            for scene_data in story.get('scenes', []):
+                StoryScene(**self._normalize_emotional_tones(scene_data))
+        except Exception as e:
+            logger.info("Not caching story with invalid scenes: %s", e)
+            return False
+        return True
     
     def _normalize_emotional_tones(self, scene_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize emotional tones to match the EmotionalTone enum values."""
+        """Normalize emotional tones to match the EmotionalTone enum values.
+        
+        The input is left untouched; only the tones mapping is rebuilt.
+        """
         if 'narration_tones' not in scene_data:
             return scene_data
         
-        # Mapping of common emotional words to enum values
-        tone_mapping = {
-            'curiosity': 'curious',
-            'wonder': 'awe',
-            'anticipation': 'excited',
-            'serenity': 'calm',
-            'warmth': 'tender',
-            'gentleness': 'tender',
-            'enlightening': 'hopeful',
-            'joy': 'joyful',
-            'encouragement': 'hopeful',
-            'enthusiasm': 'excited',
-            'delight': 'joyful',
-            'happiness': 'joyful',
-            'contentment': 'calm',
-            'satisfaction': 'calm',
-            'reflection': 'nostalgic',
-            'pride': 'determined',
-            'amazed': 'awe',
-            'enchanted': 'mysterious',
-            'welcoming': 'tender',
-            'grateful': 'tender',
-            'content': 'calm',
-            'enlightened': 'hopeful',
-            'reflective': 'nostalgic',
-            'fulfilled': 'joyful',
-            'intrigued': 'curious',
-            'trusting': 'tender',
-            'enthusiastic': 'excited',
-            'reassuring': 'calm',
-            'peaceful': 'calm',
-            'enchanting': 'mysterious'
-        }
-        
         normalized_tones = {}
         for text_segment, tone in scene_data['narration_tones'].items():
             # Convert to lowercase and map to valid enum value
-            normalized_tone = tone_mapping.get(tone.lower(), 'calm')  # Default to 'calm' if not found
-            normalized_tones[text_segment] = normalized_tone
+            tone = tone.lower()
+            if tone in _VALID_TONES:
+                normalized_tones[text_segment] = tone
+            else:
+                normalized_tones[text_segment] = _TONE_MAPPING.get(tone, 'calm')  # Default to 'calm' if not found
         
-        scene_data['narration_tones'] = normalized_tones
-        return scene_data
+        return {**scene_data, 'narration_tones': normalized_tones}
     
     def _extract_story_characters(self, story: Dict[str, Any]) -> Dict[str, str]:
         """Extract character information from story data."""
         characters = {}
         
         # Look for character information in story summary and scenes
-        story_text = story.get('story_summary', '')
-        
-        # Add character info from scenes
-        for scene in story.get('scenes', []):
-            story_text += f" {scene.get('visual_description', '')} {scene.get('narration_text', '')}"
-        
-        # Enhanced character patterns for better extraction
-        import re
-        character_patterns = [
-            r'(\w+)\s+(?:the|is a|was a)\s+([^,\.]+)',
-            r'(\w+)\s+(?:named|called)\s+([^,\.]+)',
-            r'(\w+)\s+(?:with|wearing|having)\s+([^,\.]+)',
-            r'(\w+)\s+(?:who|that)\s+([^,\.]+)',
-            r'(\w+)\s+(?:has|had)\s+([^,\.]+)',
-            r'(\w+)\s+(?:in|with)\s+([^,\.]+)',
-            r'(\w+)\s+(?:wears|wearing)\s+([^,\.]+)',
-            r'(\w+)\s+(?:with|has)\s+([^,\.]+)',
-        ]
+        text_parts = [story.get('story_summary', '')]
+        text_parts.extend(
+            f"{scene.get('visual_description', '')} {scene.get('narration_text', '')}"
+            for scene in story.get('scenes', [])
+        )
+        # Collapse whitespace once so matched descriptions need no cleanup
+        story_text = _WHITESPACE.sub(' ', ' '.join(text_parts))
         
-        for pattern in character_patterns:
-            matches = re.findall(pattern, story_text, re.IGNORECASE)
-            for match in matches:
-                character_name = match[0].strip()
-                description = match[1].strip()
-                if character_name and description and len(character_name) > 2:
-                    # Clean up the description
-                    description = re.sub(r'\s+', ' ', description).strip()
-                    characters[character_name] = description
+        if len(story_text) < _MIN_CHARACTER_TEXT_LENGTH:
+            return characters
+        
+        # Lowercasing can change the length of some non-ASCII text, in which
+        # case the offsets would no longer line up with the original
+        lowered_text = story_text.lower()
+        if len(lowered_text) == len(story_text):
+            matches = _CHARACTER_PATTERN.finditer(lowered_text)
+        else:
+            matches = _CHARACTER_PATTERN_IGNORECASE.finditer(story_text)
+        
+        for match in matches:
+            character_name = story_text[match.start(1):match.end(1)].strip()
+            description = story_text[match.start(2):match.end(2)].strip()
+            if character_name and description and len(character_name) > 2:
+                characters[character_name] = description
         
         return characters
     
-    async def _generate_images(self, story: Dict[str, Any], story_title: str) -> List[AssetGenerationStatus]:
+    async def _generate_images(self, story: Dict[str, Any], scenes: List[StoryScene],
+                             story_title: str) -> List[AssetGenerationStatus]:
         """Generate images for story scenes with character consistency."""
         if not self.image_generator:
             return []
@@ -270,96 +568,87 @@ class StoryEngineApp:
         # Extract character information from the story
         story_characters = self._extract_story_characters(story)
         
-        # Initialize character descriptions in image generator
-        if hasattr(self.image_generator, 'character_descriptions'):
-            self.image_generator.character_descriptions.update(story_characters)
+        # Start the image generator's consistency tracking with this story's characters only
+        self.image_generator.reset_story_state(story_characters)
         
-        image_statuses = []
-        for scene_data in story.get('scenes', []):
+        # Large offline jobs go through the cheaper Batch API when enabled
+        batch_config = self.image_generator.image_config.get('batch', {})
+        if batch_config.get('enabled', False) and len(scenes) >= batch_config.get('min_scenes', 6):
             try:
-                # Normalize emotional tones first
-                normalized_scene_data = self._normalize_emotional_tones(scene_data.copy())
-                
-                # Convert dictionary to StoryScene object
-                scene = StoryScene(**normalized_scene_data)
-                status = await self.image_generator.generate_scene_image(
-                    scene=scene,
-                    story_title=story_title
-                )
-                image_statuses.append(status)
+                return await self.image_generator.generate_story_images_batch(scenes, story_title)
             except Exception as e:
-                logger.error(f"Failed to generate image for scene {scene_data.get('scene_number', 'unknown')}: {e}")
-                image_statuses.append(AssetGenerationStatus(
-                    scene_number=scene_data.get('scene_number', 0),
-                    image_generated=False,
-                    image_path=None,
-                    error_message=str(e)
-                ))
+                logger.warning("Batch image generation unavailable, generating per scene: %s", e)
         
-        return image_statuses
+        # The image generator bounds its own provider requests and generates
+        # scenes with identical descriptions once
+        return await self.image_generator.generate_story_images(scenes, story_title)
     
-    async def _generate_audio(self, story: Dict[str, Any], story_title: str) -> List[AssetGenerationStatus]:
+    async def _generate_audio(self, scenes: List[StoryScene], story_title: str) -> List[AssetGenerationStatus]:
         """Generate audio for story scenes."""
         if not self.audio_generator:
             return []
         
+        tasks = [
+            self._run_bounded(
+                self._audio_semaphore,
+                self.audio_generator.generate_scene_audio(scene=scene, story_title=story_title)
+            )
+            for scene in scenes
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
         audio_statuses = []
-        for scene_data in story.get('scenes', []):
-            try:
-                # Normalize emotional tones first
-                normalized_scene_data = self._normalize_emotional_tones(scene_data.copy())
-                
-                # Convert dictionary to StoryScene object
-                scene = StoryScene(**normalized_scene_data)
-                status = await self.audio_generator.generate_scene_audio(
-                    scene=scene,
-                    story_title=story_title
-                )
-                audio_statuses.append(status)
-            except Exception as e:
-                logger.error(f"Failed to generate audio for scene {scene_data.get('scene_number', 'unknown')}: {e}")
+        for scene, result in zip(scenes, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to generate audio for scene %s: %s", scene.scene_number, result)
                 audio_statuses.append(AssetGenerationStatus(
-                    scene_number=scene_data.get('scene_number', 0),
+                    scene_number=scene.scene_number,
                     audio_generated=False,
                     audio_path=None,
-                    error_message=str(e)
+                    error_message=str(result)
                 ))
+            else:
+                audio_statuses.append(result)
         
         return audio_statuses
     
+    async def _run_bounded(self, semaphore: asyncio.Semaphore, coro):
+        """Await a coroutine while holding a concurrency slot."""
+        async with semaphore:
+            return await coro
+    
+    async def _no_assets(self) -> List[AssetGenerationStatus]:
+        """Placeholder for an asset pipeline that was not requested."""
+        return []
+    
     async def _generate_basic_outputs(self, story: Dict[str, Any], story_title: str, 
-                                    output_formats: List[str]) -> Dict[str, Any]:
+                                    output_formats: Collection[str]) -> Dict[str, Any]:
         """Generate basic outputs when full compilation is not available."""
         
         # Create output directory
-        output_dir = Path('generated_stories') / story_title
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = ensure_dir(Path('generated_stories') / story_title)
         
-        outputs = {}
+        # Write requested outputs concurrently, off the event loop
+        pending_writes = {}
         
-        # Save JSON output
         if 'json' in output_formats:
             json_path = output_dir / f"{story_title}_package.json"
-            with open(json_path, 'w') as f:
-                import json
-                json.dump(story, f, indent=2)
-            outputs['json'] = {
-                'success': True,
-                'output_path': str(json_path)
-            }
-            logger.info(f"JSON saved: {json_path}")
+            pending_writes['json'] = (json_path, asyncio.to_thread(_write_json, json_path, story))
         
-        # Save HTML output (basic version)
         if 'html' in output_formats:
             html_path = output_dir / f"{story_title}_viewer.html"
-            html_content = self._generate_basic_html(story, story_title)
-            with open(html_path, 'w') as f:
-                f.write(html_content)
-            outputs['html'] = {
+            html_chunks = self._iter_basic_html_bytes(story, story_title)
+            pending_writes['html'] = (html_path, asyncio.to_thread(atomic_write, html_path, html_chunks))
+        
+        await asyncio.gather(*(write for _, write in pending_writes.values()))
+        
+        outputs = {}
+        for format_type, (path, _) in pending_writes.items():
+            outputs[format_type] = {
                 'success': True,
-                'output_path': str(html_path)
+                'output_path': str(path)
             }
-            logger.info(f"HTML saved: {html_path}")
+            logger.info("%s saved: %s", format_type.upper(), path)
         
         return {
             'success': True,
@@ -372,124 +661,56 @@ class StoryEngineApp:
             }
         }
     
-    def _generate_basic_html(self, story_data: Dict[str, Any], title: str) -> str:
-        """Generate basic HTML viewer for the story."""
+    def _iter_basic_html_bytes(self, story_data: Dict[str, Any], title: str) -> Iterator[bytes]:
+        """Generate the basic HTML viewer for the story as encoded chunks."""
         
-        html_template = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        body {{
-            font-family: 'Georgia', serif;
-            line-height: 1.6;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: #333;
-        }}
-        .container {{
-            background: white;
-            padding: 30px;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-        }}
-        h1 {{
-            text-align: center;
-            color: #4a5568;
-            margin-bottom: 30px;
-        }}
-        .scene {{
-            margin-bottom: 40px;
-            padding: 20px;
-            border-left: 4px solid #667eea;
-            background: #f7fafc;
-        }}
-        .scene-number {{
-            font-weight: bold;
-            color: #667eea;
-            font-size: 1.2em;
-        }}
-        .plot-summary {{
-            font-style: italic;
-            color: #666;
-            margin-bottom: 15px;
-        }}
-        .narration {{
-            font-size: 1.1em;
-            margin-bottom: 15px;
-        }}
-        .visual-description {{
-            background: #e2e8f0;
-            padding: 15px;
-            border-radius: 8px;
-            font-size: 0.9em;
-            color: #4a5568;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>{title}</h1>
-        <div class="story-summary">
-            <p><strong>Summary:</strong> {story_summary}</p>
-        </div>
-        
-        {scenes_html}
-    </div>
-</body>
-</html>
-        """
+        title = escape(title)
+        yield _render_basic_html_head(title).encode('utf-8')
+        yield _BASIC_HTML_STYLE
+        yield _render_basic_html_intro(
+            title=title,
+            story_summary=escape(story_data.get('story_summary', ''))
+        ).encode('utf-8')
         
-        # Generate scenes HTML
-        scenes_html = ""
         for scene in story_data.get('scenes', []):
-            scenes_html += f"""
-            <div class="scene">
-                <div class="scene-number">Scene {scene.get('scene_number', '?')}</div>
-                <div class="plot-summary">{scene.get('plot_summary', '')}</div>
-                <div class="narration">{scene.get('narration_text', '')}</div>
-                <div class="visual-description">
-                    <strong>Visual:</strong> {scene.get('visual_description', '')}
-                </div>
-            </div>
-            """
-        
-        return html_template.format(
-            title=title,
-            story_summary=story_data.get('story_summary', ''),
-            scenes_html=scenes_html
-        )
+            yield _render_scene_html(
+                scene_number=escape(str(scene.get('scene_number', '?'))),
+                plot_summary=escape(scene.get('plot_summary', '')),
+                narration_text=escape(scene.get('narration_text', '')),
+                visual_description=escape(scene.get('visual_description', ''))
+            ).encode('utf-8')
+        
+        yield _BASIC_HTML_FOOTER
+
+
+# Sample story concept used by the demo run
+_DEMO_CONCEPT = StoryConcept(
+    characters={
+        "hero": "A curious young girl named Luna",
+        "mentor": "A wise old gardener with magical powers"
+    },
+    plot="Luna discovers a hidden garden where plants can talk and help her solve a mystery that has puzzled the village for generations",
+    moral="Friendship and curiosity can solve any problem",
+    genre="fantasy",
+    target_age="children"
+)
 
 
 async def main():
     """Main function for testing the public engine."""
     
-    # Create a sample story concept
-    concept = StoryConcept(
-        characters={
-            "hero": "A curious young girl named Luna",
-            "mentor": "A wise old gardener with magical powers"
-        },
-        plot="Luna discovers a hidden garden where plants can talk and help her solve a mystery that has puzzled the village for generations",
-        moral="Friendship and curiosity can solve any problem",
-        genre="fantasy",
-        target_age="children"
-    )
-    
     # Initialize the engine
     app = StoryEngineApp()
     
     # Generate the story
-    result = await app.generate_complete_story(
-        concept=concept,
-        story_title="magic_garden_demo",
-        output_formats=['json', 'html']
-    )
+    try:
+        result = await app.generate_complete_story(
+            concept=_DEMO_CONCEPT,
+            story_title="magic_garden_demo",
+            output_formats=['json', 'html']
+        )
+    finally:
+        await app.aclose()
     
     if result['success']:
         print("✅ Story generated successfully!")
@@ -500,4 +721,13 @@ async def main():
 
 
 if __name__ == "__main__":
+    setup_logging()
+    
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        # uvloop not available - using the default event loop
+        pass
+    
     asyncio.run(main())
@@ -8,32 +8,59 @@ using advanced LLM orchestration and prompt optimization.
 __version__ = "1.0.0"
 __author__ = "Story Engine Team"
 
-# Always available core components
-from .core.orchestrator import StoryOrchestrator
-from .core.prompt_builder import PromptBuilder
-
-# Optional components that may have heavy dependencies
-try:
-    from .generators.image_generator import ImageGenerator
-except ImportError:
-    ImageGenerator = None
-
-try:
-    from .generators.audio_generator import AudioGenerator
-except ImportError:
-    AudioGenerator = None
-
-try:
-    from .assemblers.story_compiler import StoryCompiler
-except ImportError:
-    StoryCompiler = None
+import importlib
+import importlib.util
+
+# Components are imported on first access so the package itself stays cheap
+# to import; heavy dependencies load only when a component is used.
+_LAZY = {
+    "StoryOrchestrator": (".core.orchestrator", "StoryOrchestrator"),
+    "PromptBuilder": (".core.prompt_builder", "PromptBuilder"),
+    "ImageGenerator": (".generators.image_generator", "ImageGenerator"),
+    "AudioGenerator": (".generators.audio_generator", "AudioGenerator"),
+    "StoryCompiler": (".assemblers.story_compiler", "StoryCompiler"),
+}
+
+# Third-party packages that optional components cannot import without
+_REQUIREMENTS = {
+    "ImageGenerator": ("aiohttp", "openai"),
+    "AudioGenerator": ("aiohttp", "openai"),
+    "StoryCompiler": (),
+}
+
+
+def _is_available(name):
+    """Check an optional component's dependencies without importing them."""
+    return all(importlib.util.find_spec(package) is not None
+               for package in _REQUIREMENTS[name])
+
+
+# Optional components that may have heavy dependencies resolve to None
+# when those dependencies are missing
+_UNAVAILABLE = {name for name in _REQUIREMENTS if not _is_available(name)}
 
 # Only export what's available
-__all__ = ["StoryOrchestrator", "PromptBuilder"]
-
-if ImageGenerator:
-    __all__.append("ImageGenerator")
-if AudioGenerator:
-    __all__.append("AudioGenerator") 
-if StoryCompiler:
-    __all__.append("StoryCompiler")
+__all__ = [name for name in _LAZY if name not in _UNAVAILABLE]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    if name in _UNAVAILABLE:
+        value = None
+    else:
+        module_name, attr = _LAZY[name]
+        try:
+            value = getattr(importlib.import_module(module_name, __name__), attr)
+        except ImportError:
+            if name not in _REQUIREMENTS:
+                raise
+            value = None
+    
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
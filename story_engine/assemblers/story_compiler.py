@@ -1,24 +1,37 @@
 """Story compiler for assembling multi-modal assets into final output."""
 
 import asyncio
+import functools
 import json
-import subprocess
+import math
+import os
+import shutil
+import tempfile
+from html import escape
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import logging
 from datetime import datetime
 
+# Video compilation shells out to ffmpeg rather than rendering frames in Python
+FFMPEG_PATH = shutil.which('ffmpeg')
+FFPROBE_PATH = shutil.which('ffprobe')
+FFMPEG_AVAILABLE = FFMPEG_PATH is not None and FFPROBE_PATH is not None
+
+# Audio sample rate shared by all video segments so they concatenate without re-encoding
+SEGMENT_SAMPLE_RATE = 44100
+
+# Encoder threads per ffmpeg process; concurrent encodes are capped so the total matches the cores
+FFMPEG_THREADS = 2
+
+# Buffer size for ffmpeg pipes, large enough to pass a raw 1080p frame in a few writes
+PIPE_BUFFER_SIZE = 1 << 20
+
 try:
-    from moviepy.editor import (
-        ImageClip, AudioFileClip, CompositeVideoClip, 
-        concatenate_videoclips, VideoFileClip
-    )
-    MOVIEPY_AVAILABLE = True
+    import fcntl
 except ImportError:
-    # Moviepy not available - video compilation will be disabled
-    ImageClip = AudioFileClip = CompositeVideoClip = None
-    concatenate_videoclips = VideoFileClip = None
-    MOVIEPY_AVAILABLE = False
+    # fcntl not available (Windows) - subprocess pipes keep the default size
+    fcntl = None
 
 try:
     from PIL import Image, ImageDraw, ImageFont
@@ -27,11 +40,285 @@ except ImportError:
     Image = ImageDraw = ImageFont = None
     PIL_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # orjson not available - JSON packages use the standard library encoder
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+from ..core.file_utils import atomic_write_bytes, ensure_dir
 from ..core.models import GeneratedStory, AssetGenerationStatus
 
 logger = logging.getLogger(__name__)
 
 
+def _render_interactive_html(story_title: str, story_summary: str,
+                              scenes_json: str, scene_count: int) -> str:
+    """Render the interactive story viewer page from already-escaped fields."""
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{story_title}</title>
+    <style>
+        body {{
+            font-family: 'Georgia', serif;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: #333;
+        }}
+        .story-container {{
+            background: white;
+            border-radius: 15px;
+            padding: 30px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+        }}
+        .story-title {{
+            text-align: center;
+            color: #2c3e50;
+            margin-bottom: 20px;
+            font-size: 2.5em;
+        }}
+        .story-summary {{
+            text-align: center;
+            font-style: italic;
+            margin-bottom: 30px;
+            color: #7f8c8d;
+            line-height: 1.6;
+        }}
+        .scene {{
+            margin-bottom: 40px;
+            padding: 25px;
+            border-radius: 15px;
+            background: #f8f9fa;
+            border-left: 4px solid #3498db;
+            transition: all 0.3s ease;
+        }}
+        .scene:hover {{
+            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+            transform: translateY(-2px);
+        }}
+        .scene-number {{
+            font-weight: bold;
+            color: #3498db;
+            margin-bottom: 15px;
+            font-size: 1.2em;
+        }}
+        .scene-image {{
+            width: 100%;
+            max-width: 500px;
+            border-radius: 10px;
+            margin: 20px 0;
+            display: block;
+            margin-left: auto;
+            margin-right: auto;
+            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+        }}
+        .scene-text {{
+            line-height: 1.9;
+            margin: 20px 0;
+            font-size: 1.1em;
+            text-align: justify;
+        }}
+        .transition-text {{
+            font-style: italic;
+            color: #7f8c8d;
+            margin: 15px 0;
+            padding: 10px;
+            background: rgba(52, 152, 219, 0.1);
+            border-radius: 8px;
+            border-left: 3px solid #3498db;
+        }}
+        .scene-content {{
+            margin: 15px 0;
+        }}
+        .audio-controls {{
+            text-align: center;
+            margin: 15px 0;
+        }}
+        .audio-controls audio {{
+            width: 100%;
+            max-width: 400px;
+        }}
+        .navigation {{
+            text-align: center;
+            margin: 20px 0;
+        }}
+        .nav-button {{
+            background: #3498db;
+            color: white;
+            border: none;
+            padding: 10px 20px;
+            margin: 0 10px;
+            border-radius: 5px;
+            cursor: pointer;
+            font-size: 16px;
+        }}
+        .nav-button:hover {{
+            background: #2980b9;
+        }}
+        .nav-button:disabled {{
+            background: #bdc3c7;
+            cursor: not-allowed;
+        }}
+        .scene {{
+            display: none;
+        }}
+        .scene.active {{
+            display: block;
+        }}
+    </style>
+</head>
+<body>
+    <div class="story-container">
+        <h1 class="story-title">{story_title}</h1>
+        <p class="story-summary">{story_summary}</p>
+        
+        <div id="scenes-container">
+            <!-- Scenes will be populated by JavaScript -->
+        </div>
+        
+        <div class="navigation">
+            <button class="nav-button" id="prev-btn" onclick="previousScene()">Previous</button>
+            <span id="scene-counter">Scene 1 of {scene_count}</span>
+            <button class="nav-button" id="next-btn" onclick="nextScene()">Next</button>
+        </div>
+    </div>
+
+    <script>
+        const scenes = {scenes_json};
+        let currentScene = 0;
+
+        function displayScene(sceneIndex) {{
+            const container = document.getElementById('scenes-container');
+            const scene = scenes[sceneIndex];
+            
+            let transitionFrom = '';
+            let transitionTo = '';
+            
+            // Add transition from previous scene (if available)
+            if (scene.transition_from_previous && sceneIndex > 0) {{
+                transitionFrom = `<div class="transition-text">${{scene.transition_from_previous}}</div>`;
+            }}
+            
+            // Add transition to next scene (if available)
+            if (scene.transition_to_next && sceneIndex < scenes.length - 1) {{
+                transitionTo = `<div class="transition-text">${{scene.transition_to_next}}</div>`;
+            }}
+            
+            container.innerHTML = `
+                <div class="scene active">
+                    <div class="scene-number">Scene ${{scene.number}}</div>
+                    ${{transitionFrom}}
+                    ${{scene.image_path ? `<img src="${{scene.image_path}}" alt="Scene ${{scene.number}}" class="scene-image">` : ''}}
+                    <div class="scene-content">
+                        <div class="scene-text">${{scene.narration}}</div>
+                        ${{scene.audio_path ? `
+                            <div class="audio-controls">
+                                <audio controls>
+                                    <source src="${{scene.audio_path}}" type="audio/mpeg">
+                                    Your browser does not support the audio element.
+                                </audio>
+                            </div>
+                        ` : ''}}
+                    </div>
+                    ${{transitionTo}}
+                </div>
+            `;
+            
+            // Update navigation
+            document.getElementById('scene-counter').textContent = `Scene ${{sceneIndex + 1}} of ${{scenes.length}}`;
+            document.getElementById('prev-btn').disabled = sceneIndex === 0;
+            document.getElementById('next-btn').disabled = sceneIndex === scenes.length - 1;
+        }}
+
+        function nextScene() {{
+            if (currentScene < scenes.length - 1) {{
+                currentScene++;
+                displayScene(currentScene);
+            }}
+        }}
+
+        function previousScene() {{
+            if (currentScene > 0) {{
+                currentScene--;
+                displayScene(currentScene);
+            }}
+        }}
+
+        // Initialize
+        displayScene(0);
+        
+        // Keyboard navigation
+        document.addEventListener('keydown', function(event) {{
+            if (event.key === 'ArrowRight') nextScene();
+            if (event.key === 'ArrowLeft') previousScene();
+        }});
+    </script>
+</body>
+</html>'''
+
+
+def _escape_optional(text: Optional[str]) -> Optional[str]:
+    """HTML-escape text, passing None through."""
+    return escape(text) if text else text
+
+
+def _index_by_scene(statuses: List[AssetGenerationStatus]) -> Dict[int, AssetGenerationStatus]:
+    """Map scene numbers to their asset status, keeping the first status per scene."""
+    index = {}
+    for status in statuses:
+        index.setdefault(status.scene_number, status)
+    return index
+
+
+def _file_listed(file_path: str, dir_listings: Dict[Path, frozenset]) -> bool:
+    """Check that a file exists using a cached listing of its directory."""
+    path = Path(file_path)
+    listing = dir_listings.get(path.parent)
+    if listing is None:
+        try:
+            with os.scandir(path.parent) as entries:
+                listing = frozenset(entry.name for entry in entries)
+        except OSError:
+            listing = frozenset()
+        dir_listings[path.parent] = listing
+    return path.name in listing
+
+
+def _grow_pipe(stream: asyncio.StreamWriter) -> None:
+    """Enlarge a subprocess pipe so large payloads need fewer write calls (Linux only)."""
+    set_pipe_size = getattr(fcntl, 'F_SETPIPE_SZ', None)
+    if set_pipe_size is None:
+        return
+    
+    pipe = stream.transport.get_extra_info('pipe')
+    try:
+        fcntl.fcntl(pipe.fileno(), set_pipe_size, PIPE_BUFFER_SIZE)
+    except OSError:
+        # Above the system pipe size limit - keep the default size
+        pass
+
+
+async def _no_segment() -> None:
+    """Placeholder for a card that was not rendered."""
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(path: str, size: int):
+    """Load a TrueType font once per path and size, falling back to the default font."""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
 class StoryCompiler:
     """Compile multi-modal story assets into final output formats."""
     
@@ -41,11 +328,11 @@ class StoryCompiler:
         self.output_dir.mkdir(exist_ok=True)
         
         # Check available features
-        self.moviepy_available = MOVIEPY_AVAILABLE
+        self.ffmpeg_available = FFMPEG_AVAILABLE
         self.pil_available = PIL_AVAILABLE
         
-        if not self.moviepy_available:
-            logger.warning("MoviePy not available - video compilation disabled")
+        if not self.ffmpeg_available:
+            logger.warning("ffmpeg not available - video compilation disabled")
         if not self.pil_available:
             logger.warning("PIL not available - image processing limited")
         
@@ -55,6 +342,9 @@ class StoryCompiler:
         self.video_resolution = (1920, 1080)  # Full HD
         self.fps = 24
         
+        # Shared by all compilations so concurrent stories do not oversubscribe the CPU
+        self._encode_semaphore = asyncio.Semaphore(max(1, (os.cpu_count() or 1) // FFMPEG_THREADS))
+        
         # Compilation statistics
         self.stats = {
             'total_compilations': 0,
@@ -76,11 +366,12 @@ class StoryCompiler:
         self.stats['total_compilations'] += 1
         
         try:
-            story_dir = self.output_dir / story_title
-            story_dir.mkdir(exist_ok=True)
+            story_dir = ensure_dir(self.output_dir / story_title)
             
             # Validate assets
-            asset_validation = self._validate_assets(story, image_statuses, audio_statuses)
+            asset_validation = await asyncio.to_thread(
+                self._validate_assets, story, image_statuses, audio_statuses
+            )
             if not asset_validation['valid']:
                 return {
                     'success': False,
@@ -88,45 +379,46 @@ class StoryCompiler:
                     'outputs': {}
                 }
             
-            compilation_results = {}
+            # Serialize the story model once for every format that needs plain data
+            story_payload = story.model_dump(mode='json')
             
-            # Generate different output formats
-            for format_type in output_formats:
+            async def compile_format(format_type: str) -> Dict[str, Any]:
                 try:
                     if format_type == 'mp4':
-                        if not self.moviepy_available:
-                            result = {
+                        if not self.ffmpeg_available:
+                            return {
                                 'success': False,
-                                'error': 'MoviePy not available - install with: pip install moviepy'
+                                'error': 'ffmpeg not available - install ffmpeg and make sure it is on PATH'
                             }
-                        else:
-                            result = await self._compile_video(
-                                story, image_statuses, audio_statuses, story_title
-                            )
-                    elif format_type == 'json':
-                        result = await self._compile_json_package(
+                        return await self._compile_video(
                             story, image_statuses, audio_statuses, story_title
                         )
+                    elif format_type == 'json':
+                        return await self._compile_json_package(
+                            story, story_payload, image_statuses, audio_statuses, story_title
+                        )
                     elif format_type == 'html':
-                        result = await self._compile_interactive_html(
-                            story, image_statuses, audio_statuses, story_title
+                        return await self._compile_interactive_html(
+                            story_payload, image_statuses, audio_statuses, story_title
                         )
                     elif format_type == 'epub':
-                        result = await self._compile_epub(
+                        return await self._compile_epub(
                             story, image_statuses, audio_statuses, story_title
                         )
                     else:
-                        result = {'success': False, 'error': f'Unknown format: {format_type}'}
-                    
-                    compilation_results[format_type] = result
+                        return {'success': False, 'error': f'Unknown format: {format_type}'}
                     
                 except Exception as e:
                     logger.error(f"Failed to compile {format_type}: {str(e)}")
-                    compilation_results[format_type] = {
+                    return {
                         'success': False,
                         'error': str(e)
                     }
             
+            # Generate different output formats concurrently
+            results = await asyncio.gather(*(compile_format(f) for f in output_formats))
+            compilation_results = dict(zip(output_formats, results))
+            
             # Check if any compilation succeeded
             success = any(result.get('success', False) for result in compilation_results.values())
             
@@ -194,10 +486,12 @@ class StoryCompiler:
                     'error': f"Missing audio for scenes: {sorted(missing_audio)}"
                 }
         
-        # Validate file existence
+        # Validate file existence with one directory listing per asset folder
+        dir_listings = {}
+        
         for status in image_statuses:
             if status.image_generated and status.image_path:
-                if not Path(status.image_path).exists():
+                if not _file_listed(status.image_path, dir_listings):
                     return {
                         'valid': False,
                         'error': f"Image file not found: {status.image_path}"
@@ -205,7 +499,7 @@ class StoryCompiler:
         
         for status in audio_statuses:
             if status.audio_generated and status.audio_path:
-                if not Path(status.audio_path).exists():
+                if not _file_listed(status.audio_path, dir_listings):
                     return {
                         'valid': False,
                         'error': f"Audio file not found: {status.audio_path}"
@@ -217,63 +511,68 @@ class StoryCompiler:
                            image_statuses: List[AssetGenerationStatus],
                            audio_statuses: List[AssetGenerationStatus],
                            story_title: str) -> Dict[str, Any]:
-        """Compile story into MP4 video format."""
+        """Compile story into MP4 video format.
+        
+        Each scene is encoded by its own ffmpeg process, then the segments
+        are joined with the concat demuxer without re-encoding.
+        """
         
         try:
-            # Create scene clips
-            scene_clips = []
-            
-            for scene in story.scenes:
-                # Find corresponding assets
-                image_status = next((s for s in image_statuses if s.scene_number == scene.scene_number), None)
-                audio_status = next((s for s in audio_statuses if s.scene_number == scene.scene_number), None)
+            story_dir = self.output_dir / story_title
+            images_by_scene = _index_by_scene(image_statuses)
+            audio_by_scene = _index_by_scene(audio_statuses)
+            
+            with tempfile.TemporaryDirectory(dir=story_dir) as work_dir:
+                work_dir = Path(work_dir)
+                async def encode_scene(scene) -> Optional[Tuple[Path, float]]:
+                    image_status = images_by_scene.get(scene.scene_number)
+                    audio_status = audio_by_scene.get(scene.scene_number)
+                    if not image_status or not audio_status:
+                        return None
+                    
+                    async with self._encode_semaphore:
+                        return await self._create_scene_segment(
+                            scene, image_status.image_path, audio_status.audio_path, work_dir
+                        )
                 
-                if not image_status or not audio_status:
-                    continue
+                results = await asyncio.gather(*(encode_scene(scene) for scene in story.scenes))
+                segments = [result for result in results if result]
+                
+                if not segments:
+                    return {
+                        'success': False,
+                        'error': 'No valid scene clips could be created'
+                    }
                 
-                # Create scene clip
-                scene_clip = await self._create_scene_clip(
-                    scene, image_status.image_path, audio_status.audio_path
+                # Add title and credits
+                segments = await self._add_title_and_credits(
+                    segments, story, story_title, work_dir
                 )
                 
-                if scene_clip:
-                    scene_clips.append(scene_clip)
-            
-            if not scene_clips:
-                return {
-                    'success': False,
-                    'error': 'No valid scene clips could be created'
-                }
+                # Join segments with a stream copy
+                manifest_path = work_dir / "concat.txt"
+                manifest_path.write_text(
+                    ''.join(f"file '{path.name}'\n" for path, _ in segments)
+                )
+                
+                video_path = work_dir / "complete.mp4"
+                await self._run_ffmpeg([
+                    '-f', 'concat', '-safe', '0', '-i', str(manifest_path),
+                    '-c', 'copy', '-movflags', '+faststart', str(video_path)
+                ])
+                
+                output_path = story_dir / f"{story_title}_complete.mp4"
+                os.replace(video_path, output_path)
             
-            # Concatenate all scenes
-            final_video = concatenate_videoclips(scene_clips, method="compose")
-            
-            # Add title and credits
-            final_video = await self._add_title_and_credits(final_video, story, story_title)
-            
-            # Export video
-            output_path = self.output_dir / story_title / f"{story_title}_complete.mp4"
-            final_video.write_videofile(
-                str(output_path),
-                fps=self.fps,
-                codec='libx264',
-                audio_codec='aac',
-                temp_audiofile='temp-audio.m4a',
-                remove_temp=True
-            )
+            duration = sum(segment_duration for _, segment_duration in segments)
             
             # Update stats
-            self.stats['total_output_duration'] += final_video.duration
-            
-            # Clean up
-            final_video.close()
-            for clip in scene_clips:
-                clip.close()
+            self.stats['total_output_duration'] += duration
             
             return {
                 'success': True,
                 'output_path': str(output_path),
-                'duration': final_video.duration,
+                'duration': duration,
                 'format': 'mp4'
             }
             
@@ -284,66 +583,151 @@ class StoryCompiler:
                 'error': str(e)
             }
     
-    async def _create_scene_clip(self, scene, image_path: str, audio_path: str) -> Optional[VideoFileClip]:
-        """Create a video clip for a single scene."""
+    async def _create_scene_segment(self, scene, image_path: str, audio_path: str,
+                                    work_dir: Path) -> Optional[Tuple[Path, float]]:
+        """Encode a single scene to an MP4 segment, returning its path and duration."""
         
         try:
             # Load audio to get duration
-            audio_clip = AudioFileClip(audio_path)
-            audio_duration = audio_clip.duration
-            
-            # Load and prepare image
-            image_clip = ImageClip(image_path).set_duration(audio_duration)
-            image_clip = image_clip.resize(self.video_resolution)
-            
-            # Add subtle zoom effect for visual interest
-            image_clip = image_clip.resize(lambda t: 1 + 0.02 * t / audio_duration)
+            audio_duration = await self._probe_duration(audio_path)
             
-            # Combine image and audio
-            scene_clip = image_clip.set_audio(audio_clip)
+            output_path = work_dir / f"scene_{scene.scene_number:03d}.mp4"
+            await self._run_ffmpeg(self._ffmpeg_scene_cmd(
+                image_path, audio_path, output_path, audio_duration,
+                self.fps, *self.video_resolution
+            ))
             
-            # Add scene number overlay (optional)
-            if self.config.get('video_settings', {}).get('show_scene_numbers', False):
-                scene_clip = self._add_scene_number_overlay(scene_clip, scene.scene_number)
-            
-            return scene_clip
+            return output_path, audio_duration
             
         except Exception as e:
             logger.error(f"Failed to create scene clip {scene.scene_number}: {str(e)}")
             return None
     
-    def _add_scene_number_overlay(self, clip, scene_number: int):
-        """Add scene number overlay to video clip."""
-        # This would require more complex text overlay implementation
-        # For now, return clip as-is
-        return clip
+    @staticmethod
+    def _ffmpeg_scene_cmd(image_path: str, audio_path: str, out_path: Path,
+                          duration: float, fps: int, width: int, height: int) -> List[str]:
+        """Build ffmpeg arguments for a scene with a subtle zoom over its narration."""
+        
+        frames = max(1, math.ceil(duration * fps))
+        video_filter = (
+            f"scale={width}:{height},"
+            f"zoompan=z='1+0.02*on/{frames}':d={frames}"
+            f":x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':s={width}x{height}:fps={fps},"
+            f"format=yuv420p"
+        )
+        
+        return [
+            '-i', str(image_path),
+            '-i', str(audio_path),
+            '-vf', video_filter,
+            '-map', '0:v', '-map', '1:a',
+            *StoryCompiler._segment_codec_args(),
+            '-t', f"{duration:.3f}",
+            str(out_path)
+        ]
+    
+    @staticmethod
+    def _ffmpeg_card_cmd(out_path: Path, duration: float,
+                         fps: int, width: int, height: int) -> List[str]:
+        """Build ffmpeg arguments for a still card read as one raw RGB frame from stdin."""
+        
+        return [
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f"{width}x{height}",
+            '-framerate', str(fps), '-i', 'pipe:0',
+            '-f', 'lavfi', '-i', f"anullsrc=r={SEGMENT_SAMPLE_RATE}:cl=stereo",
+            '-vf', f"tpad=stop_mode=clone:stop_duration={duration},format=yuv420p",
+            '-map', '0:v', '-map', '1:a',
+            *StoryCompiler._segment_codec_args(),
+            '-t', f"{duration:.3f}",
+            str(out_path)
+        ]
+    
+    @staticmethod
+    def _segment_codec_args() -> List[str]:
+        """Encoding settings shared by every segment so they can be concatenated losslessly."""
+        return [
+            '-c:v', 'libx264', '-tune', 'stillimage', '-pix_fmt', 'yuv420p',
+            '-threads', str(FFMPEG_THREADS),
+            '-c:a', 'aac', '-ar', str(SEGMENT_SAMPLE_RATE), '-ac', '2'
+        ]
+    
+    async def _run_ffmpeg(self, args: List[str], input_data: Optional[bytes] = None) -> None:
+        """Run ffmpeg with the given arguments, raising on failure."""
+        process = await asyncio.create_subprocess_exec(
+            FFMPEG_PATH, '-loglevel', 'error', '-y', *args,
+            stdin=asyncio.subprocess.DEVNULL if input_data is None else asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            limit=PIPE_BUFFER_SIZE
+        )
+        if input_data is not None:
+            _grow_pipe(process.stdin)
+        _, stderr = await process.communicate(input_data)
+        
+        errors = stderr.decode('utf-8', errors='replace').strip()
+        if errors:
+            logger.debug(f"ffmpeg: {errors}")
+        if process.returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with code {process.returncode}: {errors}")
     
-    async def _add_title_and_credits(self, video_clip, story: GeneratedStory, story_title: str):
-        """Add title card and credits to the video."""
+    async def _probe_duration(self, media_path: str) -> float:
+        """Read the duration of a media file in seconds with ffprobe."""
+        process = await asyncio.create_subprocess_exec(
+            FFPROBE_PATH, '-v', 'error', '-show_entries', 'format=duration',
+            '-of', 'default=noprint_wrappers=1:nokey=1', str(media_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        
+        if process.returncode != 0:
+            raise RuntimeError(f"ffprobe failed for {media_path}: {stderr.decode(errors='replace').strip()}")
+        return float(stdout.decode().strip())
+    
+    async def _add_title_and_credits(self, segments: List[Tuple[Path, float]],
+                                     story: GeneratedStory, story_title: str,
+                                     work_dir: Path) -> List[Tuple[Path, float]]:
+        """Add title card and credits segments around the story."""
+        
+        if not self.pil_available:
+            return segments
         
         try:
-            # Create title card
-            title_clip = await self._create_title_card(story_title, story.story_summary)
+            # Create title card and credits as raw frames
+            title_frame, credits_frame = await asyncio.gather(
+                asyncio.to_thread(self._create_title_card, story_title, story.story_summary),
+                asyncio.to_thread(self._create_credits_card)
+            )
+            
+            async def encode_card(frame: bytes, name: str, duration: float) -> Tuple[Path, float]:
+                output_path = work_dir / name
+                async with self._encode_semaphore:
+                    await self._run_ffmpeg(
+                        self._ffmpeg_card_cmd(output_path, duration, self.fps, *self.video_resolution),
+                        input_data=frame
+                    )
+                return output_path, duration
             
-            # Create credits
-            credits_clip = await self._create_credits_card()
+            title_segment, credits_segment = await asyncio.gather(
+                encode_card(title_frame, "title.mp4", 3.0) if title_frame else _no_segment(),
+                encode_card(credits_frame, "credits.mp4", 2.0) if credits_frame else _no_segment()
+            )
             
             # Combine: title + story + credits
-            if title_clip and credits_clip:
-                final_clip = concatenate_videoclips([title_clip, video_clip, credits_clip])
-            elif title_clip:
-                final_clip = concatenate_videoclips([title_clip, video_clip])
-            else:
-                final_clip = video_clip
+            final_segments = list(segments)
+            if title_segment:
+                final_segments.insert(0, title_segment)
+            if credits_segment:
+                final_segments.append(credits_segment)
             
-            return final_clip
+            return final_segments
             
         except Exception as e:
             logger.error(f"Failed to add title/credits: {str(e)}")
-            return video_clip
+            return segments
     
-    async def _create_title_card(self, title: str, summary: str) -> Optional[VideoFileClip]:
-        """Create an animated title card."""
+    def _create_title_card(self, title: str, summary: str) -> Optional[bytes]:
+        """Render the title card as a raw RGB frame."""
         
         try:
             # Create title image using PIL
@@ -351,12 +735,8 @@ class StoryCompiler:
             draw = ImageDraw.Draw(img)
             
             # Try to load a nice font, fallback to default
-            try:
-                title_font = ImageFont.truetype("arial.ttf", 72)
-                subtitle_font = ImageFont.truetype("arial.ttf", 36)
-            except:
-                title_font = ImageFont.load_default()
-                subtitle_font = ImageFont.load_default()
+            title_font = _load_font("arial.ttf", 72)
+            subtitle_font = _load_font("arial.ttf", 36)
             
             # Calculate text positions
             title_bbox = draw.textbbox((0, 0), title, font=title_font)
@@ -369,66 +749,64 @@ class StoryCompiler:
             # Draw title
             draw.text((title_x, title_y), title, fill='white', font=title_font)
             
-            # Draw summary (wrapped)
-            summary_words = summary.split()
-            lines = []
-            current_line = []
-            
-            for word in summary_words:
-                test_line = ' '.join(current_line + [word])
-                test_bbox = draw.textbbox((0, 0), test_line, font=subtitle_font)
-                test_width = test_bbox[2] - test_bbox[0]
-                
-                if test_width <= self.video_resolution[0] - 200:  # Leave margins
-                    current_line.append(word)
-                else:
-                    if current_line:
-                        lines.append(' '.join(current_line))
-                    current_line = [word]
-            
-            if current_line:
-                lines.append(' '.join(current_line))
+            # Draw summary (wrapped), leaving margins and limited to 3 lines
+            lines = self._wrap_text(
+                draw, summary, subtitle_font, self.video_resolution[0] - 200, max_lines=3
+            )
             
-            # Draw summary lines
+            # Draw summary lines centered in one layout pass, 50px apart
             summary_y = title_y + title_height + 50
             line_height = 50
+            line_spacing = line_height - draw.textbbox((0, 0), "A", font=subtitle_font)[3]
             
-            for i, line in enumerate(lines[:3]):  # Limit to 3 lines
-                line_bbox = draw.textbbox((0, 0), line, font=subtitle_font)
-                line_width = line_bbox[2] - line_bbox[0]
-                line_x = (self.video_resolution[0] - line_width) // 2
-                
-                draw.text((line_x, summary_y + i * line_height), line, 
-                         fill='#ecf0f1', font=subtitle_font)
-            
-            # Save title image
-            title_image_path = self.output_dir / "temp_title.png"
-            img.save(title_image_path)
-            
-            # Create video clip from image
-            title_clip = ImageClip(str(title_image_path)).set_duration(3)
-            
-            # Clean up temp file
-            title_image_path.unlink()
+            draw.multiline_text(
+                (self.video_resolution[0] // 2, summary_y), '\n'.join(lines),
+                fill='#ecf0f1', font=subtitle_font, anchor='ma',
+                align='center', spacing=line_spacing
+            )
             
-            return title_clip
+            return img.tobytes()
             
         except Exception as e:
             logger.error(f"Failed to create title card: {str(e)}")
             return None
     
-    async def _create_credits_card(self) -> Optional[VideoFileClip]:
-        """Create a credits card."""
+    @staticmethod
+    def _wrap_text(draw, text: str, font, max_width: int, max_lines: int) -> List[str]:
+        """Greedily wrap text to max_width, measuring each word once."""
+        
+        space_width = draw.textlength(' ', font=font)
+        lines = []
+        current_line = []
+        current_width = 0.0
+        
+        for word in text.split():
+            word_width = draw.textlength(word, font=font)
+            test_width = current_width + space_width + word_width if current_line else word_width
+            
+            if test_width <= max_width or not current_line:
+                current_line.append(word)
+                current_width = test_width
+            else:
+                lines.append(' '.join(current_line))
+                if len(lines) == max_lines:
+                    return lines
+                current_line = [word]
+                current_width = word_width
+        
+        if current_line:
+            lines.append(' '.join(current_line))
+        return lines[:max_lines]
+    
+    def _create_credits_card(self) -> Optional[bytes]:
+        """Render the credits card as a raw RGB frame."""
         
         try:
             # Simple credits card
             img = Image.new('RGB', self.video_resolution, color='#34495e')
             draw = ImageDraw.Draw(img)
             
-            try:
-                font = ImageFont.truetype("arial.ttf", 48)
-            except:
-                font = ImageFont.load_default()
+            font = _load_font("arial.ttf", 48)
             
             credits_text = "Created with Automated Story Engine"
             credits_bbox = draw.textbbox((0, 0), credits_text, font=font)
@@ -439,22 +817,14 @@ class StoryCompiler:
             
             draw.text((credits_x, credits_y), credits_text, fill='white', font=font)
             
-            # Save and create clip
-            credits_image_path = self.output_dir / "temp_credits.png"
-            img.save(credits_image_path)
-            
-            credits_clip = ImageClip(str(credits_image_path)).set_duration(2)
-            
-            # Clean up
-            credits_image_path.unlink()
-            
-            return credits_clip
+            return img.tobytes()
             
         except Exception as e:
             logger.error(f"Failed to create credits: {str(e)}")
             return None
     
     async def _compile_json_package(self, story: GeneratedStory,
+                                  story_payload: Dict[str, Any],
                                   image_statuses: List[AssetGenerationStatus],
                                   audio_statuses: List[AssetGenerationStatus],
                                   story_title: str) -> Dict[str, Any]:
@@ -472,7 +842,7 @@ class StoryCompiler:
                         self._estimate_scene_duration(scene) for scene in story.scenes
                     )
                 },
-                'story': story.dict(),
+                'story': story_payload,
                 'assets': {
                     'images': [
                         {
@@ -498,16 +868,29 @@ class StoryCompiler:
                 }
             }
             
-            # Save JSON package
-            output_path = self.output_dir / story_title / f"{story_title}_package.json"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(story_package, f, indent=2, ensure_ascii=False)
+            # Save JSON package with a single write
+            story_dir = self.output_dir / story_title
+            output_path = story_dir / f"{story_title}_package.json"
+            writes = [(output_path, self._dump_json(story_package, indent=True))]
             
-            return {
+            # Compact copy for programs that consume the package
+            minified_path = None
+            if self.config.get('output', {}).get('minified_json', False):
+                minified_path = story_dir / f"{story_title}_package.min.json"
+                writes.append((minified_path, self._dump_json(story_package, indent=False)))
+            
+            await asyncio.gather(*(
+                asyncio.to_thread(atomic_write_bytes, path, payload) for path, payload in writes
+            ))
+            
+            result = {
                 'success': True,
                 'output_path': str(output_path),
                 'format': 'json'
             }
+            if minified_path:
+                result['minified_path'] = str(minified_path)
+            return result
             
         except Exception as e:
             logger.error(f"JSON compilation failed: {str(e)}")
@@ -516,44 +899,63 @@ class StoryCompiler:
                 'error': str(e)
             }
     
-    async def _compile_interactive_html(self, story: GeneratedStory,
+    @staticmethod
+    def _dump_json(data: Any, indent: bool) -> bytes:
+        """Serialize data to UTF-8 JSON, indented or compact."""
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=option)
+        
+        if indent:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    
+    async def _compile_interactive_html(self, story_payload: Dict[str, Any],
                                       image_statuses: List[AssetGenerationStatus],
                                       audio_statuses: List[AssetGenerationStatus],
                                       story_title: str) -> Dict[str, Any]:
         """Compile story into an interactive HTML format."""
         
         try:
-            html_template = self._get_html_template()
+            images_by_scene = _index_by_scene(image_statuses)
+            audio_by_scene = _index_by_scene(audio_statuses)
             
             # Prepare scene data for HTML
             scenes_data = []
-            for scene in story.scenes:
-                image_status = next((s for s in image_statuses if s.scene_number == scene.scene_number), None)
-                audio_status = next((s for s in audio_statuses if s.scene_number == scene.scene_number), None)
+            for scene in story_payload['scenes']:
+                image_status = images_by_scene.get(scene['scene_number'])
+                audio_status = audio_by_scene.get(scene['scene_number'])
                 
+                # Text is inserted with innerHTML, so escape it once here
                 scene_data = {
-                    'number': scene.scene_number,
-                    'plot_summary': scene.plot_summary,
-                    'narration': scene.narration_text,
-                    'image_path': Path(image_status.image_path).name if image_status and image_status.image_path else None,
-                    'audio_path': Path(audio_status.audio_path).name if audio_status and audio_status.audio_path else None,
-                    'transition_from_previous': getattr(scene, 'transition_from_previous', None),
-                    'transition_to_next': getattr(scene, 'transition_to_next', None)
+                    'number': scene['scene_number'],
+                    'plot_summary': escape(scene['plot_summary']),
+                    'narration': escape(scene['narration_text']),
+                    'image_path': escape(Path(image_status.image_path).name) if image_status and image_status.image_path else None,
+                    'audio_path': escape(Path(audio_status.audio_path).name) if audio_status and audio_status.audio_path else None,
+                    'transition_from_previous': _escape_optional(scene.get('transition_from_previous')),
+                    'transition_to_next': _escape_optional(scene.get('transition_to_next'))
                 }
                 scenes_data.append(scene_data)
             
+            if ORJSON_AVAILABLE:
+                scenes_json = orjson.dumps(scenes_data).decode('utf-8')
+            else:
+                scenes_json = json.dumps(scenes_data)
+            
             # Generate HTML
-            html_content = html_template.format(
-                story_title=story_title,
-                story_summary=story.story_summary,
-                scenes_json=json.dumps(scenes_data),
+            html_content = _render_interactive_html(
+                story_title=escape(story_title),
+                story_summary=escape(story_payload['story_summary']),
+                scenes_json=scenes_json,
                 scene_count=len(scenes_data)
             )
             
             # Save HTML file
             output_path = self.output_dir / story_title / f"{story_title}_interactive.html"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            await asyncio.to_thread(atomic_write_bytes, output_path, html_content.encode('utf-8'))
             
             return {
                 'success': True,
@@ -568,214 +970,6 @@ class StoryCompiler:
                 'error': str(e)
             }
     
-    def _get_html_template(self) -> str:
-        """Get HTML template for interactive story."""
-        return '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{story_title}</title>
-    <style>
-        body {{
-            font-family: 'Georgia', serif;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: #333;
-        }}
-        .story-container {{
-            background: white;
-            border-radius: 15px;
-            padding: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }}
-        .story-title {{
-            text-align: center;
-            color: #2c3e50;
-            margin-bottom: 20px;
-            font-size: 2.5em;
-        }}
-        .story-summary {{
-            text-align: center;
-            font-style: italic;
-            margin-bottom: 30px;
-            color: #7f8c8d;
-            line-height: 1.6;
-        }}
-        .scene {{
-            margin-bottom: 40px;
-            padding: 25px;
-            border-radius: 15px;
-            background: #f8f9fa;
-            border-left: 4px solid #3498db;
-            transition: all 0.3s ease;
-        }}
-        .scene:hover {{
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            transform: translateY(-2px);
-        }}
-        .scene-number {{
-            font-weight: bold;
-            color: #3498db;
-            margin-bottom: 15px;
-            font-size: 1.2em;
-        }}
-        .scene-image {{
-            width: 100%;
-            max-width: 500px;
-            border-radius: 10px;
-            margin: 20px 0;
-            display: block;
-            margin-left: auto;
-            margin-right: auto;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }}
-        .scene-text {{
-            line-height: 1.9;
-            margin: 20px 0;
-            font-size: 1.1em;
-            text-align: justify;
-        }}
-        .transition-text {{
-            font-style: italic;
-            color: #7f8c8d;
-            margin: 15px 0;
-            padding: 10px;
-            background: rgba(52, 152, 219, 0.1);
-            border-radius: 8px;
-            border-left: 3px solid #3498db;
-        }}
-        .scene-content {{
-            margin: 15px 0;
-        }}
-        .audio-controls {{
-            text-align: center;
-            margin: 15px 0;
-        }}
-        .audio-controls audio {{
-            width: 100%;
-            max-width: 400px;
-        }}
-        .navigation {{
-            text-align: center;
-            margin: 20px 0;
-        }}
-        .nav-button {{
-            background: #3498db;
-            color: white;
-            border: none;
-            padding: 10px 20px;
-            margin: 0 10px;
-            border-radius: 5px;
-            cursor: pointer;
-            font-size: 16px;
-        }}
-        .nav-button:hover {{
-            background: #2980b9;
-        }}
-        .nav-button:disabled {{
-            background: #bdc3c7;
-            cursor: not-allowed;
-        }}
-        .scene {{
-            display: none;
-        }}
-        .scene.active {{
-            display: block;
-        }}
-    </style>
-</head>
-<body>
-    <div class="story-container">
-        <h1 class="story-title">{story_title}</h1>
-        <p class="story-summary">{story_summary}</p>
-        
-        <div id="scenes-container">
-            <!-- Scenes will be populated by JavaScript -->
-        </div>
-        
-        <div class="navigation">
-            <button class="nav-button" id="prev-btn" onclick="previousScene()">Previous</button>
-            <span id="scene-counter">Scene 1 of {scene_count}</span>
-            <button class="nav-button" id="next-btn" onclick="nextScene()">Next</button>
-        </div>
-    </div>
-
-    <script>
-        const scenes = {scenes_json};
-        let currentScene = 0;
-
-        function displayScene(sceneIndex) {{
-            const container = document.getElementById('scenes-container');
-            const scene = scenes[sceneIndex];
-            
-            let transitionFrom = '';
-            let transitionTo = '';
-            
-            // Add transition from previous scene (if available)
-            if (scene.transition_from_previous && sceneIndex > 0) {{
-                transitionFrom = `<div class="transition-text">${{scene.transition_from_previous}}</div>`;
-            }}
-            
-            // Add transition to next scene (if available)
-            if (scene.transition_to_next && sceneIndex < scenes.length - 1) {{
-                transitionTo = `<div class="transition-text">${{scene.transition_to_next}}</div>`;
-            }}
-            
-            container.innerHTML = `
-                <div class="scene active">
-                    <div class="scene-number">Scene ${{scene.number}}</div>
-                    ${{transitionFrom}}
-                    ${{scene.image_path ? `<img src="${{scene.image_path}}" alt="Scene ${{scene.number}}" class="scene-image">` : ''}}
-                    <div class="scene-content">
-                        <div class="scene-text">${{scene.narration}}</div>
-                        ${{scene.audio_path ? `
-                            <div class="audio-controls">
-                                <audio controls>
-                                    <source src="${{scene.audio_path}}" type="audio/mpeg">
-                                    Your browser does not support the audio element.
-                                </audio>
-                            </div>
-                        ` : ''}}
-                    </div>
-                    ${{transitionTo}}
-                </div>
-            `;
-            
-            // Update navigation
-            document.getElementById('scene-counter').textContent = `Scene ${{sceneIndex + 1}} of ${{scenes.length}}`;
-            document.getElementById('prev-btn').disabled = sceneIndex === 0;
-            document.getElementById('next-btn').disabled = sceneIndex === scenes.length - 1;
-        }}
-
-        function nextScene() {{
-            if (currentScene < scenes.length - 1) {{
-                currentScene++;
-                displayScene(currentScene);
-            }}
-        }}
-
-        function previousScene() {{
-            if (currentScene > 0) {{
-                currentScene--;
-                displayScene(currentScene);
-            }}
-        }}
-
-        // Initialize
-        displayScene(0);
-        
-        // Keyboard navigation
-        document.addEventListener('keydown', function(event) {{
-            if (event.key === 'ArrowRight') nextScene();
-            if (event.key === 'ArrowLeft') previousScene();
-        }});
-    </script>
-</body>
-</html>'''
-    
     async def _compile_epub(self, story: GeneratedStory,
                           image_statuses: List[AssetGenerationStatus],
                           audio_statuses: List[AssetGenerationStatus],
@@ -791,16 +985,13 @@ class StoryCompiler:
     
     def _estimate_scene_duration(self, scene) -> float:
         """Estimate duration of a scene based on text length."""
-        # Rough estimation: 150 words per minute speaking rate
-        word_count = len(scene.narration_text.split())
+        # Rough estimation: 150 words per minute speaking rate, counting
+        # words by their separating spaces to avoid building a word list
+        word_count = scene.narration_text.count(' ') + 1
         return max(word_count / 2.5, 5)  # Minimum 5 seconds per scene
     
     def get_compilation_stats(self) -> Dict[str, Any]:
         """Get compilation statistics."""
-        stats = self.stats.copy()
-        if stats['total_compilations'] > 0:
-            stats['success_rate'] = stats['successful_compilations'] / stats['total_compilations']
-        else:
-            stats['success_rate'] = 0
-        
-        return stats
+        total = self.stats['total_compilations']
+        success_rate = self.stats['successful_compilations'] / total if total > 0 else 0
+        return {**self.stats, 'success_rate': success_rate}
@@ -0,0 +1,43 @@
+"""Configuration loading shared by the story engine components."""
+
+import asyncio
+import os
+from functools import lru_cache
+from typing import Dict, Any
+
+
+def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
+    """Load configuration from YAML file.
+    
+    The parsed result is cached per path and modification time, so the
+    app, orchestrator and prompt builder share a single parse. Callers
+    must treat the returned dictionary as read-only.
+    """
+    try:
+        mtime = os.path.getmtime(config_path)
+    except FileNotFoundError:
+        return {}
+    return _load_config_cached(config_path, mtime)
+
+
+@lru_cache(maxsize=None)
+def load_env() -> None:
+    """Load variables from a .env file once per process."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+async def load_config_async(config_path: str = "config.yaml") -> Dict[str, Any]:
+    """Load configuration without blocking the event loop on file I/O."""
+    return await asyncio.to_thread(load_config, config_path)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a configuration file (cached by path and modification time)."""
+    import yaml
+    
+    # LibYAML's C loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(config_path, 'rb') as f:
+        return yaml.load(f, Loader=loader) or {}
@@ -0,0 +1,69 @@
+"""File output helpers shared by the story writers."""
+
+import asyncio
+import os
+import uuid
+from pathlib import Path
+from typing import AsyncIterable, Iterable, Set, Union
+
+# Large buffer so a rendered document reaches the OS in as few writes as possible
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Directories already created by this process
+_CREATED_DIRS: Set[str] = set()
+
+
+def ensure_dir(path: Union[str, Path]) -> Path:
+    """Create a directory (and its parents) once per process."""
+    path = Path(path)
+    key = str(path)
+    if key not in _CREATED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(key)
+    return path
+
+
+def atomic_write(path: Union[str, Path], chunks: Iterable[bytes]) -> None:
+    """Write chunks to a temporary file, then move it over the target path.
+    
+    Readers never observe a partially written file, and a failed write
+    leaves any previous version in place.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, 'xb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(chunks)
+            f.flush()
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """Atomically write a single bytes payload to path."""
+    atomic_write(path, (data,))
+
+
+def atomic_copy(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Atomically copy a file to dst without loading it into memory."""
+    with open(src, 'rb') as f:
+        atomic_write(dst, iter(lambda: f.read(WRITE_BUFFER_SIZE), b''))
+
+
+async def atomic_write_stream(path: Union[str, Path], chunks: AsyncIterable[bytes]) -> None:
+    """Atomically write chunks to path as they arrive from an async source."""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        f = await asyncio.to_thread(open, tmp_path, 'xb', buffering=WRITE_BUFFER_SIZE)
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(f.write, chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+        await asyncio.to_thread(os.replace, tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
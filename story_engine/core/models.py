@@ -1,7 +1,8 @@
 """Data models for the story engine."""
 
-from typing import List, Dict, Optional, Literal
-from pydantic import BaseModel, Field, validator
+import hashlib
+from typing import Any, List, Dict, Optional, Literal, Tuple
+from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 
 
@@ -25,6 +26,10 @@ class EmotionalTone(str, Enum):
     PASSIONATE = "passionate"
 
 
+# Same values as EmotionalTone; literal validation is cheaper than building enum members
+EmotionalToneLiteral = Literal[tuple(tone.value for tone in EmotionalTone)]
+
+
 class StoryScene(BaseModel):
     """Model for a single story scene."""
     scene_number: int = Field(..., ge=1, description="Scene number in sequence")
@@ -34,25 +39,19 @@ class StoryScene(BaseModel):
                                    description="Detailed visual prompt for image generation")
     narration_text: str = Field(..., min_length=50, max_length=1200,
                                description="Full narration text for the scene with seamless transitions")
-    narration_tones: Dict[str, EmotionalTone] = Field(...,
-                                                     description="Mapping of text segments to emotional tones")
+    narration_tones: Dict[str, EmotionalToneLiteral] = Field(...,
+                                                            description="Mapping of text segments to emotional tones")
     transition_from_previous: Optional[str] = Field(None, max_length=200,
                                                    description="Seamless transition from previous scene")
     transition_to_next: Optional[str] = Field(None, max_length=200,
                                              description="Seamless transition to next scene")
     
-    @validator('narration_tones')
-    def validate_narration_mapping(cls, v, values):
+    @field_validator('narration_tones', mode='after')
+    @classmethod
+    def validate_narration_mapping(cls, v):
         """Ensure all narration text is mapped to tones."""
-        if 'narration_text' in values:
-            narration = values['narration_text']
-            mapped_text = ' '.join(v.keys())
-            # Basic validation that most text is covered
-            coverage = len(mapped_text) / len(narration)
-            if coverage < 0.7:
-                # Temporarily relax validation for testing character consistency
-                # raise ValueError("Narration tones must cover at least 70% of the text")
-                pass
+        # Temporarily relax validation for testing character consistency; tones
+        # are not yet required to cover at least 70% of the narration text
         return v
 
 
@@ -69,11 +68,12 @@ class GeneratedStory(BaseModel):
     """Complete generated story structure."""
     story_summary: str = Field(..., min_length=50, max_length=1000,
                               description="Brief summary of the entire story")
-    scenes: List[StoryScene] = Field(..., min_items=3, max_items=20,
+    scenes: List[StoryScene] = Field(..., min_length=3, max_length=20,
                                     description="List of story scenes")
     metadata: Optional[StoryMetadata] = None
     
-    @validator('scenes')
+    @field_validator('scenes', mode='after')
+    @classmethod
     def validate_scene_numbering(cls, v):
         """Ensure scenes are properly numbered sequentially."""
         expected_numbers = list(range(1, len(v) + 1))
@@ -91,6 +91,20 @@ class StoryConcept(BaseModel):
     genre: Optional[str] = "fantasy"
     target_age: Optional[str] = "children"
     style_examples: Optional[List[str]] = Field(None, description="Example story styles to follow")
+    
+    def to_prompt_modules(self, complexity: str = "standard") -> Tuple[str, Dict[str, Any]]:
+        """Split the concept into a shared preamble id and per-story prompt fields.
+        
+        The preamble id only depends on genre, target age and complexity, so
+        concepts that share them can reuse the same prompt prefix.
+        """
+        preamble_key = f"{self.genre}|{self.target_age}|{complexity}"
+        preamble_id = hashlib.blake2b(preamble_key.encode('utf-8'), digest_size=8).hexdigest()
+        return preamble_id, {
+            'characters': self.characters,
+            'plot': self.plot,
+            'moral': self.moral
+        }
 
 
 class GenerationConfig(BaseModel):
@@ -5,35 +5,203 @@ proprietary delegation strategies or advanced techniques.
 """
 
 import asyncio
-import json
+import hashlib
+import importlib.util
 import logging
-from typing import Dict, Any, Optional, List
+import re
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+from pydantic_core import from_json
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    # httpx not available - provider SDKs manage their own connections
+    httpx = None
+    HTTPX_AVAILABLE = False
+
+# HTTP/2 multiplexing needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+from .config import load_config
 from .models import StoryConcept, GeneratedStory
 from .prompt_builder import PromptBuilder
 
 logger = logging.getLogger(__name__)
 
+# JSON string literals (matched whole, so braces inside them are skipped) or braces
+_JSON_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]', re.DOTALL)
+
+
+class _JsonObjectScanner:
+    """Track streamed text until the first top-level JSON object is closed."""
+    
+    __slots__ = ('depth', 'in_string', 'escape')
+    
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+    
+    def feed(self, text: str) -> bool:
+        """Consume a chunk of text; return True once the object is complete."""
+        if not self.depth and '{' not in text:
+            return False
+        
+        for char in text:
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == '\\':
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '{':
+                self.depth += 1
+            elif not self.depth:
+                continue
+            elif char == '"':
+                self.in_string = True
+            elif char == '}':
+                self.depth -= 1
+                if not self.depth:
+                    return True
+        return False
+
+
+def _openai_delta_text(chunk) -> Optional[str]:
+    """Text carried by an OpenAI chat completion stream chunk."""
+    return chunk.choices[0].delta.content if chunk.choices else None
+
+
+def _anthropic_delta_text(event) -> Optional[str]:
+    """Text carried by an Anthropic message stream event."""
+    if event.type == 'content_block_delta' and event.delta.type == 'text_delta':
+        return event.delta.text
+    return None
+
+
+class _SharedProviders:
+    """Provider clients and connection pools shared by orchestrators on one event loop."""
+    
+    __slots__ = ('providers', 'http_clients', 'holders')
+    
+    def __init__(self, providers: Dict[str, Any], http_clients: List[Any]):
+        self.providers = providers
+        self.http_clients = http_clients
+        self.holders = 0
+
 
 class StoryOrchestrator:
     """Basic story orchestrator for public use."""
     
+    # Shared provider clients per event loop, keyed by the settings they are built from
+    _shared_providers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, _SharedProviders]]" = (
+        weakref.WeakKeyDictionary()
+    )
+    
     def __init__(self, config_path: str = "config.yaml"):
         self.config = self._load_config(config_path)
         self.prompt_builder = PromptBuilder(config_path)
-        self.providers = self._initialize_providers()
+        self.stream_responses = self.config.get('llm_models', {}).get('stream_responses', True)
+        self._providers_key = self._get_providers_key()
+        self._shared: Optional[_SharedProviders] = None
+        self._shared_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dispatch: Dict[str, Callable[..., Awaitable[Optional[str]]]] = {
+            'openai': self._call_openai,
+            'anthropic': self._call_anthropic
+        }
         
+    @classmethod
+    async def create(cls, config_path: str = "config.yaml") -> "StoryOrchestrator":
+        """Build an orchestrator off the event loop (config is read from disk)."""
+        return await asyncio.to_thread(cls, config_path)
+    
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file."""
-        try:
-            with open(config_path, 'r') as f:
-                import yaml
-                return yaml.safe_load(f)
-        except FileNotFoundError:
-            return {}
+        return load_config(config_path)
+    
+    def _get_providers_key(self) -> Tuple:
+        """Key the provider registry on the settings the clients are built from."""
+        llm_config = self.config.get('llm_models', {})
+        return (
+            llm_config.get('primary', {}).get('name', 'gpt-4o'),
+            llm_config.get('secondary', {}).get('name', 'claude-3-5-sonnet-20241022'),
+            tuple(sorted(llm_config.get('connection_pool', {}).items()))
+        )
+    
+    @property
+    def providers(self) -> Dict[str, Any]:
+        """Provider clients for the running event loop, acquired on first use.
+        
+        Clients are shared with other orchestrators built from the same
+        settings on the same loop, since their pools are bound to it.
+        """
+        loop = asyncio.get_running_loop()
+        if self._shared_loop is not loop:
+            self._release()
+            registry = self._shared_providers
+            for closed_loop in [other for other in registry if other.is_closed()]:
+                del registry[closed_loop]
+            
+            pools = registry.setdefault(loop, {})
+            shared = pools.get(self._providers_key)
+            if shared is None:
+                http_clients: List[Any] = []
+                shared = _SharedProviders(self._initialize_providers(http_clients), http_clients)
+                pools[self._providers_key] = shared
+            shared.holders += 1
+            self._shared, self._shared_loop = shared, loop
+        return self._shared.providers
+    
+    def _release(self) -> Optional[_SharedProviders]:
+        """Drop this orchestrator's hold on its shared providers.
+        
+        Returns the entry when this was its last holder, so its pools can be closed.
+        """
+        shared, loop = self._shared, self._shared_loop
+        if shared is None:
+            return None
+        self._shared = self._shared_loop = None
+        
+        shared.holders -= 1
+        if shared.holders:
+            return None
+        pools = self._shared_providers.get(loop, {})
+        if pools.get(self._providers_key) is shared:
+            del pools[self._providers_key]
+        return shared
     
-    def _initialize_providers(self) -> Dict[str, Any]:
+    def _client_options(self, sdk, http_clients: List[Any]) -> Dict[str, Any]:
+        """Build provider client options with a persistent keep-alive connection pool."""
+        pool_config = self.config.get('llm_models', {}).get('connection_pool', {})
+        options = {'max_retries': pool_config.get('max_retries', 2)}
+        
+        if hasattr(sdk, 'DefaultAsyncHttpxClient'):
+            # Newer SDKs ship a pre-configured client class (possibly on a vendored httpx)
+            client_class = sdk.DefaultAsyncHttpxClient
+            limits_class = type(sdk.DEFAULT_CONNECTION_LIMITS)
+        elif HTTPX_AVAILABLE:
+            client_class, limits_class = httpx.AsyncClient, httpx.Limits
+        else:
+            return options
+        
+        http_client = client_class(
+            http2=pool_config.get('http2', True) and HTTP2_AVAILABLE,
+            limits=limits_class(
+                max_connections=pool_config.get('max_connections', 100),
+                max_keepalive_connections=pool_config.get('max_keepalive_connections', 50)
+            ),
+            timeout=pool_config.get('timeout', 60)
+        )
+        http_clients.append(http_client)
+        options['http_client'] = http_client
+        return options
+    
+    def _initialize_providers(self, http_clients: List[Any]) -> Dict[str, Any]:
         """Initialize basic LLM providers."""
         providers = {}
         
@@ -41,7 +209,7 @@ class StoryOrchestrator:
         try:
             import openai
             providers['openai'] = {
-                'client': openai.AsyncOpenAI(),
+                'client': openai.AsyncOpenAI(**self._client_options(openai, http_clients)),
                 'model': self.config.get('llm_models', {}).get('primary', {}).get('name', 'gpt-4o')
             }
         except ImportError:
@@ -51,7 +219,7 @@ class StoryOrchestrator:
         try:
             import anthropic
             providers['anthropic'] = {
-                'client': anthropic.AsyncAnthropic(),
+                'client': anthropic.AsyncAnthropic(**self._client_options(anthropic, http_clients)),
                 'model': self.config.get('llm_models', {}).get('secondary', {}).get('name', 'claude-3-5-sonnet-20241022')
             }
         except ImportError:
@@ -59,23 +227,32 @@ class StoryOrchestrator:
         
         return providers
     
+    async def aclose(self) -> None:
+        """Release the provider connection pools.
+        
+        The pools are shared with other orchestrators on the same event
+        loop and are closed once the last of them releases them.
+        """
+        loop = self._shared_loop
+        shared = self._release()
+        if shared is not None and loop is asyncio.get_running_loop():
+            await asyncio.gather(*(client.aclose() for client in shared.http_clients))
+    
     async def generate_story(self, concept: StoryConcept, 
                            complexity: str = "standard") -> Dict[str, Any]:
         """Generate a story using basic orchestration."""
         
         try:
-            # Build prompt
-            prompt = await self.prompt_builder.build_prompt(concept, complexity)
+            # Build prompt, shared preamble first so providers can reuse its cached prefix
+            system_prompt, prompt = await self.prompt_builder.build_prompt_modules(concept, complexity)
             
-            # Try providers in order
-            for provider_name, provider_config in self.providers.items():
-                try:
-                    response = await self._call_provider(provider_name, provider_config, prompt)
-                    if response:
-                        return self._process_response(response, concept)
-                except Exception as e:
-                    logger.warning(f"Provider {provider_name} failed: {e}")
-                    continue
+            if self.config.get('llm_models', {}).get('race_providers', False):
+                result = await self._race_providers(prompt, system_prompt, concept)
+            else:
+                result = await self._try_providers_in_order(prompt, system_prompt, concept)
+            
+            if result:
+                return result
             
             return {
                 'success': False,
@@ -91,51 +268,153 @@ class StoryOrchestrator:
                 'story': None
             }
     
-    async def _call_provider(self, provider_name: str, provider_config: Dict[str, Any], 
-                           prompt: str) -> Optional[str]:
-        """Call a specific LLM provider."""
-        
-        if provider_name == 'openai':
-            return await self._call_openai(provider_config, prompt)
-        elif provider_name == 'anthropic':
-            return await self._call_anthropic(provider_config, prompt)
+    async def _try_providers_in_order(self, prompt: str, system_prompt: str,
+                                      concept: StoryConcept) -> Optional[Dict[str, Any]]:
+        """Call providers one at a time, returning the first response."""
+        for provider_name, provider_config in self.providers.items():
+            try:
+                response = await self._call_provider(provider_name, provider_config,
+                                                     prompt, system_prompt)
+                if response:
+                    return self._process_response(response, concept)
+            except Exception as e:
+                logger.warning(f"Provider {provider_name} failed: {e}")
+                continue
         
         return None
     
-    async def _call_openai(self, config: Dict[str, Any], prompt: str) -> Optional[str]:
+    async def _race_providers(self, prompt: str, system_prompt: str,
+                              concept: StoryConcept) -> Optional[Dict[str, Any]]:
+        """Call all providers concurrently and keep the first valid story.
+        
+        Responses that arrive together are considered in provider priority
+        order. Remaining calls are cancelled once a story is accepted, but
+        every provider still bills for its request, so this is opt-in via
+        llm_models.race_providers.
+        """
+        tasks = {
+            asyncio.create_task(self._call_provider(provider_name, provider_config,
+                                                    prompt, system_prompt)): provider_name
+            for provider_name, provider_config in self.providers.items()
+        }
+        priority = {task: index for index, task in enumerate(tasks)}
+        pending = set(tasks)
+        fallback = None
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in sorted(done, key=priority.get):
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        logger.warning(f"Provider {tasks[task]} failed: {e}")
+                        continue
+                    
+                    if not response:
+                        continue
+                    
+                    result = self._process_response(response, concept)
+                    if result['success']:
+                        logger.info(f"Story generated by {tasks[task]}")
+                        return result
+                    fallback = fallback or result
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        return fallback
+    
+    async def _call_provider(self, provider_name: str, provider_config: Dict[str, Any], 
+                           prompt: str, system_prompt: str = "") -> Optional[str]:
+        """Call a specific LLM provider."""
+        call = self._dispatch.get(provider_name)
+        if call is None:
+            return None
+        return await call(provider_config, prompt, system_prompt)
+    
+    async def _call_openai(self, config: Dict[str, Any], prompt: str,
+                          system_prompt: str = "") -> Optional[str]:
         """Call OpenAI API."""
+        messages = [{"role": "user", "content": prompt}]
+        extra_body = {}
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+            # Route requests sharing a preamble to the same prompt cache
+            extra_body['prompt_cache_key'] = hashlib.blake2b(
+                system_prompt.encode('utf-8'), digest_size=8
+            ).hexdigest()
+        
         try:
             response = await config['client'].chat.completions.create(
                 model=config['model'],
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 max_tokens=4000,
-                temperature=0.7
+                temperature=0.7,
+                stream=self.stream_responses,
+                extra_body=extra_body or None
             )
+            if self.stream_responses:
+                return await self._read_stream(response, _openai_delta_text)
             return response.choices[0].message.content
         except Exception as e:
             logger.error(f"OpenAI API call failed: {e}")
             return None
     
-    async def _call_anthropic(self, config: Dict[str, Any], prompt: str) -> Optional[str]:
+    async def _call_anthropic(self, config: Dict[str, Any], prompt: str,
+                             system_prompt: str = "") -> Optional[str]:
         """Call Anthropic API."""
+        extra_args = {}
+        if system_prompt:
+            extra_args['system'] = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        
         try:
             response = await config['client'].messages.create(
                 model=config['model'],
                 max_tokens=4000,
                 temperature=0.7,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prompt}],
+                stream=self.stream_responses,
+                **extra_args
             )
+            if self.stream_responses:
+                return await self._read_stream(response, _anthropic_delta_text)
             return response.content[0].text
         except Exception as e:
             logger.error(f"Anthropic API call failed: {e}")
             return None
     
+    async def _read_stream(self, stream, delta_text: Callable[[Any], Optional[str]]) -> str:
+        """Collect streamed response text, stopping once the story JSON is complete.
+        
+        Anything the model writes after the closing brace is never waited for.
+        """
+        scanner = _JsonObjectScanner()
+        parts = []
+        try:
+            async for event in stream:
+                text = delta_text(event)
+                if text:
+                    parts.append(text)
+                    if scanner.feed(text):
+                        break
+        finally:
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                await close()
+        return ''.join(parts)
+    
     def _process_response(self, response: str, concept: StoryConcept) -> Dict[str, Any]:
         """Process LLM response and validate."""
         try:
             # Basic JSON extraction
             json_text = self._extract_json(response)
-            story_data = json.loads(json_text)
+            story_data = from_json(json_text, cache_strings='all')
             
             # Basic validation
             if not self._validate_story_data(story_data):
@@ -161,13 +440,25 @@ class StoryOrchestrator:
     
     def _extract_json(self, text: str) -> str:
         """Basic JSON extraction from response."""
-        # Find JSON boundaries
         start = text.find('{')
-        end = text.rfind('}') + 1
-        
-        if start == -1 or end == 0:
+        if start == -1:
             raise ValueError("No JSON found in response")
         
+        # Single pass from the first brace until the outermost object closes
+        depth = 0
+        for match in _JSON_TOKEN.finditer(text, start):
+            token = match.group()
+            if token == '{':
+                depth += 1
+            elif token == '}':
+                depth -= 1
+                if depth == 0:
+                    return text[start:match.end()]
+        
+        # Unbalanced (e.g. truncated) response - fall back to the last closing brace
+        end = text.rfind('}') + 1
+        if end == 0:
+            raise ValueError("No JSON found in response")
         return text[start:end]
     
     def _validate_story_data(self, data: Dict[str, Any]) -> bool:
@@ -182,3 +473,4 @@ class StoryOrchestrator:
             return False
         
         return True
+
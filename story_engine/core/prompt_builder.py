@@ -4,66 +4,27 @@ This version contains basic prompt building functionality without
 proprietary techniques or advanced delegation strategies.
 """
 
-import json
-import yaml
-from typing import List, Dict, Optional, Any
-from pathlib import Path
+import asyncio
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 from jinja2 import Template
-import random
 
+try:
+    import tiktoken
+except ImportError:
+    # tiktoken not available - prompt tokens are estimated from length
+    tiktoken = None
+
+from .config import load_config
 from .models import StoryConcept, EmotionalTone
 
 
-class PromptBuilder:
-    """Basic prompt builder for public use."""
-    
-    def __init__(self, config_path: str = "config.yaml", examples_dir: str = "examples"):
-        self.config = self._load_config(config_path)
-        self.examples_dir = Path(examples_dir)
-        self.example_stories = self._load_example_stories()
-        self.master_template = Template(self._get_basic_template())
-        
-    def _load_config(self, config_path: str) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
-        try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
-        except FileNotFoundError:
-            return {}
-    
-    def _load_example_stories(self) -> List[Dict[str, Any]]:
-        """Load example stories for few-shot learning."""
-        examples = []
-        if self.examples_dir.exists():
-            for example_file in self.examples_dir.glob("*.json"):
-                try:
-                    with open(example_file, 'r') as f:
-                        example_data = json.load(f)
-                        examples.append(example_data)
-                except Exception as e:
-                    print(f"Warning: Could not load example {example_file}: {e}")
-        return examples
-    
-    def _get_basic_template(self) -> str:
-        """Basic prompt template for public use."""
-        return """
+# Shared instructions that only depend on genre, audience and complexity
+_PREAMBLE_TEMPLATE = Template("""
 # Story Generation Request
-
-## Story Concept
-Title: {{ concept.title or "Untitled" }}
-Genre: {{ concept.genre }}
-Target Age: {{ concept.target_age }}
-
-## Characters
-{% for role, description in concept.characters.items() %}
-- {{ role }}: {{ description }}
-{% endfor %}
-
-## Plot
-{{ concept.plot }}
-
-## Moral/Lesson
-{{ concept.moral }}
+Genre: {{ genre }}
+Target Age: {{ target_age }}
 
 ## Requirements
 Generate a story with {{ min_scenes }}-{{ max_scenes }} scenes.
@@ -120,13 +81,30 @@ Return valid JSON with this structure:
     }
   ]
 }
+        """)
+
+# Per-story concept details, appended after the shared preamble
+_CONCEPT_TEMPLATE = Template("""
+## Story Concept
+Title: {{ title or "Untitled" }}
+
+## Characters
+{% for role, description in characters.items() %}
+- {{ role }}: {{ description }}
+{% endfor %}
+
+## Plot
+{{ plot }}
+
+## Moral/Lesson
+{{ moral }}
 
 ## Character Consistency - CRITICAL REQUIREMENT
 You MUST maintain EXACT character consistency across all scenes:
 
 ### Character Details to Maintain:
-{% for role, description in concept.characters.items() %}
-**{{ role }}**: {{ description }}
+{% for role, description in characters.items() %}
+**{{ role }}**{% if not compact %}: {{ description }}{% endif %}
 - ALWAYS use this exact description in every scene
 - NEVER change clothing, appearance, or physical features
 - Keep the same name and personality throughout
@@ -139,35 +117,115 @@ You MUST maintain EXACT character consistency across all scenes:
 - Maintain consistent character positioning and interactions
 
 Generate the story:
-        """
+        """)
+
+# Rendered concept sections kept per PromptBuilder
+_MAX_CACHED_CONCEPT_PROMPTS = 512
+
+# Tones the model may use in narration_tones
+_VALID_TONES = tuple(tone.value for tone in EmotionalTone)
+
+# Rough characters-per-token ratio used when tiktoken is unavailable
+_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(model_name: str):
+    """Return the tiktoken encoding for a model, or None if it cannot be loaded."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except Exception:
+        try:
+            return tiktoken.get_encoding("o200k_base")
+        except Exception:
+            return None
+
+
+def _count_tokens(text: str, model_name: str) -> int:
+    """Count (or estimate) the tokens a model would see for the text."""
+    encoding = _get_encoding(model_name)
+    if encoding is None:
+        return len(text) // _CHARS_PER_TOKEN
+    return len(encoding.encode(text))
+
+
+class PromptBuilder:
+    """Basic prompt builder for public use."""
+    
+    def __init__(self, config_path: str = "config.yaml"):
+        self.config = self._load_config(config_path)
+        self.preamble_template = _PREAMBLE_TEMPLATE
+        self.concept_template = _CONCEPT_TEMPLATE
+        self._preambles: Dict[str, str] = {}
+        self._concept_prompts: "OrderedDict[str, str]" = OrderedDict()
+        
+    @classmethod
+    async def create(cls, config_path: str = "config.yaml") -> "PromptBuilder":
+        """Build a prompt builder off the event loop (config is read from disk)."""
+        return await asyncio.to_thread(cls, config_path)
+    
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """Load configuration from YAML file."""
+        return load_config(config_path)
     
     async def build_prompt(self, concept: StoryConcept, 
                           complexity: str = "standard") -> str:
-        """Build a basic prompt with examples."""
+        """Build a basic prompt."""
+        preamble, concept_prompt = await self.build_prompt_modules(concept, complexity)
+        return preamble + concept_prompt
+    
+    async def build_prompt_modules(self, concept: StoryConcept,
+                                   complexity: str = "standard") -> Tuple[str, str]:
+        """Build the prompt as a shared preamble and a per-concept section.
         
-        # Get random examples (basic approach)
-        relevant_examples = self._get_random_examples()
+        The preamble is identical for every concept with the same genre,
+        target age and complexity, so sending it first lets providers reuse
+        their cached prompt prefix.
+        """
+        preamble_id, fields = concept.to_prompt_modules(complexity)
         
-        # Get scene parameters
-        scene_params = self._get_scene_parameters(complexity)
+        preamble = self._preambles.get(preamble_id)
+        if preamble is None:
+            scene_params = self._get_scene_parameters(complexity)
+            preamble = self.preamble_template.render(
+                genre=concept.genre,
+                target_age=concept.target_age,
+                min_scenes=scene_params['min_scenes'],
+                max_scenes=scene_params['max_scenes'],
+                valid_tones=_VALID_TONES
+            )
+            self._preambles[preamble_id] = preamble
         
-        # Build the prompt
-        prompt = self.master_template.render(
-            concept=concept,
-            examples=relevant_examples,
-            min_scenes=scene_params['min_scenes'],
-            max_scenes=scene_params['max_scenes'],
-            valid_tones=[tone.value for tone in EmotionalTone]
-        )
+        # Reuse the concept section when the same concept is prompted again
+        concept_key = concept.model_dump_json(include=set(fields))
+        concept_prompt = self._concept_prompts.get(concept_key)
+        if concept_prompt is None:
+            concept_prompt = self._render_concept_prompt(fields)
+            self._concept_prompts[concept_key] = concept_prompt
+            if len(self._concept_prompts) > _MAX_CACHED_CONCEPT_PROMPTS:
+                self._concept_prompts.popitem(last=False)
+        else:
+            self._concept_prompts.move_to_end(concept_key)
         
-        return prompt
+        return preamble, concept_prompt
     
-    def _get_random_examples(self) -> List[Dict[str, Any]]:
-        """Get random examples (basic approach)."""
-        if not self.example_stories:
-            return []
-        return random.sample(self.example_stories, 
-                           min(2, len(self.example_stories)))
+    def _render_concept_prompt(self, fields: Dict[str, Any]) -> str:
+        """Render the concept section, compacting it when over the token budget."""
+        concept_prompt = self.concept_template.render(compact=False, **fields)
+        
+        llm_config = self.config.get('llm_models', {})
+        budget = llm_config.get('max_concept_prompt_tokens')
+        if not budget:
+            return concept_prompt
+        
+        model_name = llm_config.get('primary', {}).get('name', 'gpt-4o')
+        if _count_tokens(concept_prompt, model_name) <= budget:
+            return concept_prompt
+        
+        # Character descriptions are listed once instead of twice
+        return self.concept_template.render(compact=True, **fields)
     
     def _get_scene_parameters(self, complexity: str) -> Dict[str, int]:
         """Get scene parameters based on complexity."""
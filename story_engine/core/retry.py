@@ -0,0 +1,46 @@
+"""Helpers for retrying transient provider errors with backoff."""
+
+import asyncio
+import random
+from typing import Optional
+
+import aiohttp
+import openai
+
+try:
+    import httpx
+except ImportError:
+    # httpx not available - only aiohttp and SDK network errors are classified
+    httpx = None
+
+# HTTP statuses worth retrying on the same provider before falling back
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+# Longest wait between retries, in seconds
+MAX_RETRY_DELAY = 30.0
+
+# Network errors that are worth retrying
+_TRANSIENT_ERRORS = (asyncio.TimeoutError, aiohttp.ClientConnectionError, openai.APIConnectionError)
+if httpx is not None:
+    _TRANSIENT_ERRORS += (httpx.TransportError,)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a provider error is transient (timeouts, dropped connections, 429/5xx)."""
+    if isinstance(error, _TRANSIENT_ERRORS):
+        return True
+    status = getattr(error, 'status_code', None) or getattr(error, 'status', None)
+    return status in RETRYABLE_STATUS
+
+
+def retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds."""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for a zero-based retry attempt."""
+    return min(MAX_RETRY_DELAY, 2 ** attempt) * random.uniform(0.5, 1.0)
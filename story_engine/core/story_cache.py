@@ -0,0 +1,224 @@
+"""Persistent cache for generated stories.
+
+Stories are stored in a local SQLite database keyed by a hash of the
+story concept and the LLM models, so repeating a concept skips the LLM
+round trip. Recent
+stories are also kept in a bounded in-process LRU in front of the
+database. An optional semantic tier embeds concepts with
+sentence-transformers and reuses a story when a near-identical concept
+was generated before.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from pathlib import Path
+
+from .models import StoryConcept
+
+try:
+    import orjson
+except ImportError:
+    # orjson not available - cache entries use the standard library encoder
+    orjson = None
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    # sentence-transformers not available - only exact matches are cached
+    np = SentenceTransformer = None
+    SEMANTIC_CACHE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class StoryCache:
+    """Exact and near-match cache of generated stories backed by SQLite."""
+    
+    def __init__(self, cache_path: str = "./cache/story_cache.sqlite3",
+                 semantic_matching: bool = False,
+                 similarity_threshold: float = 0.95,
+                 embedding_model: str = "all-MiniLM-L6-v2",
+                 memory_size: int = 256,
+                 model_key: str = ""):
+        self.cache_path = Path(cache_path)
+        self.model_key = model_key
+        self.memory_size = memory_size
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        self.semantic_matching = semantic_matching and SEMANTIC_CACHE_AVAILABLE
+        
+        if semantic_matching and not SEMANTIC_CACHE_AVAILABLE:
+            logger.warning("sentence-transformers not available - semantic story cache disabled")
+        
+        self._connection = None
+        self._embedder = None
+        self._lock = threading.Lock()
+        # Serialized stories, so callers always get their own copy
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "StoryCache":
+        """Create a cache from the `story_cache` configuration section."""
+        cache_config = config.get('story_cache', {})
+        llm_config = config.get('llm_models', {})
+        return cls(
+            cache_path=cache_config.get('path', "./cache/story_cache.sqlite3"),
+            semantic_matching=cache_config.get('semantic_matching', False),
+            similarity_threshold=cache_config.get('similarity_threshold', 0.95),
+            embedding_model=cache_config.get('embedding_model', "all-MiniLM-L6-v2"),
+            memory_size=cache_config.get('memory_size', 256),
+            model_key='|'.join((
+                llm_config.get('primary', {}).get('name', 'gpt-4o'),
+                llm_config.get('secondary', {}).get('name', 'claude-3-5-sonnet-20241022')
+            ))
+        )
+    
+    async def get(self, concept: StoryConcept, complexity: str = "standard") -> Optional[Dict[str, Any]]:
+        """Return a cached story for the concept, or None on a miss."""
+        key = self.concept_key(concept, complexity)
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            logger.info("Story cache hit (memory)")
+            return self._loads(data)
+        
+        try:
+            data = await asyncio.to_thread(self._locked, self._get, concept, complexity)
+        except Exception as e:
+            logger.warning("Story cache lookup failed: %s", e)
+            return None
+        
+        if data is None:
+            return None
+        self._remember(key, data)
+        return self._loads(data)
+    
+    async def set(self, concept: StoryConcept, complexity: str, story: Dict[str, Any]) -> None:
+        """Store a generated story for the concept."""
+        data = self._dumps(story)
+        self._remember(self.concept_key(concept, complexity), data)
+        try:
+            await asyncio.to_thread(self._locked, self._set, concept, complexity, data)
+        except Exception as e:
+            logger.warning("Story cache update failed: %s", e)
+    
+    def concept_key(self, concept: StoryConcept, complexity: str = "standard") -> str:
+        """Build a stable hash key for a concept, complexity and the LLM models."""
+        payload = {
+            'concept': concept.model_dump(mode='json'),
+            'complexity': complexity,
+            'models': self.model_key
+        }
+        if orjson is not None:
+            canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        else:
+            canonical = json.dumps(
+                payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+            ).encode('utf-8')
+        return hashlib.blake2b(canonical, digest_size=20).hexdigest()
+    
+    @staticmethod
+    def _dumps(story: Dict[str, Any]) -> str:
+        """Serialize a story for storage."""
+        if orjson is not None:
+            return orjson.dumps(story).decode('utf-8')
+        return json.dumps(story, ensure_ascii=False)
+    
+    @staticmethod
+    def _loads(data: str) -> Dict[str, Any]:
+        """Deserialize a stored story."""
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    
+    def _remember(self, key: str, data: str) -> None:
+        """Add a serialized story to the in-process LRU, evicting the oldest entry."""
+        if self.memory_size <= 0:
+            return
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+    
+    def _locked(self, func, *args):
+        """Run a cache operation while holding the connection lock."""
+        with self._lock:
+            return func(*args)
+    
+    def _get(self, concept: StoryConcept, complexity: str) -> Optional[str]:
+        """Look up a serialized story by exact key, then by concept similarity."""
+        connection = self._connect()
+        row = connection.execute(
+            "SELECT story FROM stories WHERE key = ?",
+            (self.concept_key(concept, complexity),)
+        ).fetchone()
+        
+        if row:
+            logger.info("Story cache hit (exact match)")
+            return row[0]
+        
+        if not self.semantic_matching:
+            return None
+        
+        query = self._embed(concept)
+        best_story, best_score = None, self.similarity_threshold
+        for story, embedding in connection.execute(
+            "SELECT story, embedding FROM stories WHERE complexity = ? AND embedding IS NOT NULL",
+            (self._scope(complexity),)
+        ):
+            score = float(np.dot(query, np.frombuffer(embedding, dtype=np.float32)))
+            if score >= best_score:
+                best_story, best_score = story, score
+        
+        if best_story is None:
+            return None
+        
+        logger.info("Story cache hit (similarity %.3f)", best_score)
+        return best_story
+    
+    def _set(self, concept: StoryConcept, complexity: str, data: str) -> None:
+        """Insert or replace a serialized story."""
+        embedding = self._embed(concept).tobytes() if self.semantic_matching else None
+        
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO stories (key, complexity, embedding, story, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.concept_key(concept, complexity), self._scope(complexity), embedding,
+                 data, time.time())
+            )
+    
+    def _scope(self, complexity: str) -> str:
+        """Group near-match candidates by complexity and LLM models."""
+        return f"{complexity}|{self.model_key}"
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database, creating it on first use."""
+        if self._connection is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.cache_path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS stories ("
+                "key TEXT PRIMARY KEY, complexity TEXT, embedding BLOB, "
+                "story TEXT NOT NULL, created_at REAL)"
+            )
+        return self._connection
+    
+    def _embed(self, concept: StoryConcept):
+        """Embed the descriptive fields of a concept as a unit vector."""
+        if self._embedder is None:
+            self._embedder = SentenceTransformer(self.embedding_model)
+        
+        characters = '; '.join(f"{role}: {desc}" for role, desc in sorted(concept.characters.items()))
+        text = f"{concept.genre} | {concept.target_age} | {characters} | {concept.plot} | {concept.moral}"
+        return self._embedder.encode(text, normalize_embeddings=True).astype(np.float32)
@@ -3,8 +3,14 @@
 import os
 import asyncio
 import aiohttp
+import hashlib
+import importlib.util
 import json
-from typing import Dict, Any, List, Optional
+import re
+import shutil
+import tempfile
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 import logging
 import xml.etree.ElementTree as ET
@@ -14,14 +20,151 @@ try:
 except ImportError:
     AsyncElevenLabs = None
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    # httpx not available - Azure TTS uses the aiohttp session
+    httpx = None
+    HTTPX_AVAILABLE = False
+
+# HTTP/2 multiplexing needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Chunked narrations are joined with ffmpeg's concat demuxer when it is installed
+FFMPEG_PATH = shutil.which('ffmpeg')
+
 import openai
-from dotenv import load_dotenv
 
+from ..core.config import load_env
+from ..core.file_utils import atomic_copy, atomic_write_bytes, atomic_write_stream, ensure_dir
+from ..core.retry import RETRYABLE_STATUS, backoff_delay, is_retryable, retry_after
 from ..core.models import StoryScene, EmotionalTone, AssetGenerationStatus
 
-load_dotenv()
+load_env()
 logger = logging.getLogger(__name__)
 
+# Patterns used to turn SSML back into plain narration text
+_TAG_RE = re.compile(r'<[^>]+>')
+_SSML_ATTR_RE = re.compile(
+    r'\b(rate|pitch|volume|prosody|emphasis|break)\s*[=:]\s*["\']?[^"\'\s]+["\']?', re.IGNORECASE
+)
+_SSML_WORDS_RE = re.compile(
+    r'\b(?:rate|pitch|volume|high|low|medium|fast|slow|soft|loud|prosody|emphasis|break)\b',
+    re.IGNORECASE
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+_COMMA_RE = re.compile(r'\s*,\s*')
+_PERIOD_RE = re.compile(r'\s*\.\s*')
+_EXCLAMATION_RE = re.compile(r'\s*!\s*')
+_QUESTION_RE = re.compile(r'\s*\?\s*')
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Pauses inserted after sentence ends and dialogue quotes; tags match too so
+# their attribute values are left untouched
+_PAUSE_RE = re.compile(r'<[^>]*>|[.!?]|&quot;')
+_PAUSES = {
+    '.': '.<break time="500ms"/>',
+    '!': '!<break time="500ms"/>',
+    '?': '?<break time="500ms"/>',
+    '&quot;': '&quot;<break time="750ms"/>',
+}
+_SCENE_TRANSITION = '<speak><break time="1s"/>'
+
+# Azure responses are read and written in chunks of this size
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Audio settings that change the synthesized output, and so key the TTS cache
+_TTS_OUTPUT_SETTINGS = ('model', 'voice', 'speed', 'output_format', 'voice_id', 'model_id', 'voice_name')
+
+
+def _chunk_text(text: str, max_chars: int = 1000) -> List[str]:
+    """Pack whole sentences greedily into chunks of at most max_chars.
+    
+    A single sentence longer than max_chars becomes its own chunk.
+    """
+    chunks: List[str] = []
+    current = ''
+    for sentence in _SENTENCE_BREAK_RE.split(text.strip()):
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _write_concat_parts(parts: List[bytes]) -> Path:
+    """Write MP3 parts and a concat manifest to a new temporary directory."""
+    work_dir = Path(tempfile.mkdtemp(prefix='tts_concat_'))
+    names = []
+    for index, part in enumerate(parts):
+        name = f"part{index:03d}.mp3"
+        (work_dir / name).write_bytes(part)
+        names.append(name)
+    (work_dir / 'concat.txt').write_text(''.join(f"file '{name}'\n" for name in names))
+    return work_dir
+
+
+async def _concat_mp3(parts: List[bytes]) -> bytes:
+    """Join MP3 parts into one stream with a single header.
+    
+    Each part carries its own header, so a plain byte join can make
+    duration probes report only the first part. ffmpeg's concat demuxer
+    rewrites the header for the whole stream; without ffmpeg the frames
+    are concatenated directly.
+    """
+    if len(parts) == 1 or FFMPEG_PATH is None:
+        return b"".join(parts)
+    
+    work_dir = await asyncio.to_thread(_write_concat_parts, parts)
+    try:
+        output_path = work_dir / 'joined.mp3'
+        process = await asyncio.create_subprocess_exec(
+            FFMPEG_PATH, '-loglevel', 'error', '-y',
+            '-f', 'concat', '-safe', '0', '-i', str(work_dir / 'concat.txt'),
+            '-c', 'copy', str(output_path),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            logger.warning(f"ffmpeg concat failed, joining MP3 parts directly: "
+                           f"{stderr.decode('utf-8', errors='replace').strip()}")
+            return b"".join(parts)
+        return await asyncio.to_thread(output_path.read_bytes)
+    finally:
+        await asyncio.to_thread(shutil.rmtree, work_dir, True)
+
+
+class _RateLimiter:
+    """Space requests evenly to stay under a requests-per-minute limit."""
+    
+    def __init__(self, requests_per_minute: float):
+        self.interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+    
+    async def acquire(self) -> None:
+        """Wait for the next free request slot."""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _tone_tags(tone_params: Dict[str, str]) -> Tuple[str, str]:
+    """Build the opening and closing SSML tags for a tone's prosody parameters."""
+    prosody_tag = ' '.join(f'{param}="{value}"' for param, value in tone_params.items())
+    
+    # Add emphasis for loud tones
+    if any('loud' in value for value in tone_params.values()):
+        return f'<prosody {prosody_tag}><emphasis level="moderate">', '</emphasis></prosody>'
+    return f'<prosody {prosody_tag}>', '</prosody>'
+
 
 class SSMLBuilder:
     """Build SSML (Speech Synthesis Markup Language) from narration and tones."""
@@ -46,6 +189,9 @@ class SSMLBuilder:
         EmotionalTone.PASSIONATE: {"rate": "medium", "pitch": "+2st", "volume": "loud"}
     }
     
+    # Opening and closing tags per tone, built once from TONE_MAPPINGS
+    _TONE_TAGS = {tone: _tone_tags(params) for tone, params in TONE_MAPPINGS.items()}
+    
     @classmethod
     def build_ssml(cls, narration_text: str, narration_tones: Dict[str, EmotionalTone]) -> str:
         """Build SSML document from narration text and emotional tones."""
@@ -71,9 +217,7 @@ class SSMLBuilder:
                     ssml_parts.append(cls._escape_ssml_text(before_text))
             
             # Add the segment with emotional styling
-            tone_params = cls.TONE_MAPPINGS.get(tone, cls.TONE_MAPPINGS[EmotionalTone.CALM])
-            styled_segment = cls._apply_tone_styling(text_segment, tone_params)
-            ssml_parts.append(styled_segment)
+            ssml_parts.append(cls._apply_tone_styling(text_segment, tone))
             
             # Update processed position
             processed_chars = segment_start + len(text_segment)
@@ -89,26 +233,20 @@ class SSMLBuilder:
         return ''.join(ssml_parts)
     
     @classmethod
-    def _apply_tone_styling(cls, text: str, tone_params: Dict[str, str]) -> str:
-        """Apply SSML styling based on tone parameters."""
-        escaped_text = cls._escape_ssml_text(text)
-        
-        # Build prosody tag
-        prosody_attrs = []
-        for param, value in tone_params.items():
-            prosody_attrs.append(f'{param}="{value}"')
-        
-        prosody_tag = ' '.join(prosody_attrs)
-        
-        # Add emphasis for certain tones
-        if any(param in tone_params and 'loud' in str(value) for param, value in tone_params.items()):
-            return f'<prosody {prosody_tag}><emphasis level="moderate">{escaped_text}</emphasis></prosody>'
-        else:
-            return f'<prosody {prosody_tag}>{escaped_text}</prosody>'
+    def build_plain_text(cls, narration_text: str) -> str:
+        """Build the plain narration for providers that do not read SSML."""
+        return _WHITESPACE_RE.sub(' ', narration_text).strip()
+    
+    @classmethod
+    def _apply_tone_styling(cls, text: str, tone: EmotionalTone) -> str:
+        """Wrap text in the SSML tags for a tone (unknown tones read as calm)."""
+        open_tag, close_tag = cls._TONE_TAGS.get(tone, cls._TONE_TAGS[EmotionalTone.CALM])
+        return f"{open_tag}{cls._escape_ssml_text(text)}{close_tag}"
     
     @classmethod
     def _escape_ssml_text(cls, text: str) -> str:
         """Escape special characters for SSML."""
+        # Chained str.replace runs in C and beats a str.translate table here
         return (text.replace('&', '&amp;')
                    .replace('<', '&lt;')
                    .replace('>', '&gt;')
@@ -118,17 +256,12 @@ class SSMLBuilder:
     @classmethod
     def add_pauses_and_breaks(cls, ssml: str, scene_number: int) -> str:
         """Add natural pauses and breaks to SSML."""
-        # Add scene transition pause at the beginning (except first scene)
-        if scene_number > 1:
-            ssml = ssml.replace('<speak>', '<speak><break time="1s"/>')
+        # Add pauses after sentences and longer pauses after dialogue, in one pass
+        ssml = _PAUSE_RE.sub(lambda match: _PAUSES.get(match.group(0), match.group(0)), ssml)
         
-        # Add pauses after sentences
-        ssml = ssml.replace('.', '.<break time="500ms"/>')
-        ssml = ssml.replace('!', '!<break time="500ms"/>')
-        ssml = ssml.replace('?', '?<break time="500ms"/>')
-        
-        # Add longer pauses after dialogue
-        ssml = ssml.replace('"', '"<break time="750ms"/>')
+        # Add scene transition pause at the beginning (except first scene)
+        if scene_number > 1 and ssml.startswith('<speak>'):
+            ssml = _SCENE_TRANSITION + ssml[len('<speak>'):]
         
         return ssml
 
@@ -139,9 +272,18 @@ class AudioProvider:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
     
-    async def generate_audio(self, ssml: str, scene_number: int) -> Dict[str, Any]:
-        """Generate audio from SSML."""
+    async def generate_audio(self, ssml: str, scene_number: int,
+                             plain_text: Optional[str] = None,
+                             audio_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Generate audio from SSML (or the plain narration, for providers without SSML).
+        
+        Providers that can stream may write straight to audio_path and return
+        it in place of audio_data.
+        """
         raise NotImplementedError
+    
+    async def aclose(self) -> None:
+        """Release network resources held by the provider."""
 
 
 class OpenAITTSProvider(AudioProvider):
@@ -150,12 +292,16 @@ class OpenAITTSProvider(AudioProvider):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.client = openai.AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        self.chunk_chars = config.get('chunk_chars', 1000)
     
-    async def generate_audio(self, ssml: str, scene_number: int) -> Dict[str, Any]:
+    async def generate_audio(self, ssml: str, scene_number: int,
+                             plain_text: Optional[str] = None,
+                             audio_path: Optional[Path] = None) -> Dict[str, Any]:
         """Generate audio using OpenAI TTS API."""
         try:
-            # Convert SSML to plain text
-            plain_text = self._ssml_to_text(ssml)
+            # Convert SSML to plain text unless the narration was passed directly
+            if plain_text is None:
+                plain_text = self._ssml_to_text(ssml)
             
             # Debug logging
             logger.debug(f"Original SSML: {ssml[:200]}...")
@@ -166,16 +312,15 @@ class OpenAITTSProvider(AudioProvider):
                 logger.warning("Empty text after SSML conversion, using original")
                 plain_text = ssml
             
-            # Generate audio using OpenAI TTS
-            response = await self.client.audio.speech.create(
-                model=self.config.get('model', 'tts-1'),
-                voice=self.config.get('voice', 'alloy'),
-                input=plain_text,
-                speed=self.config.get('speed', 1.0)
-            )
-            
-            # Get audio data
-            audio_data = response.content
+            # Long narrations are synthesized as concurrent sentence-aligned chunks
+            # and joined into a single MP3 stream
+            if self.chunk_chars and len(plain_text) > self.chunk_chars:
+                parts = await asyncio.gather(
+                    *(self._synthesize(chunk) for chunk in _chunk_text(plain_text, self.chunk_chars))
+                )
+                audio_data = await _concat_mp3(list(parts))
+            else:
+                audio_data = await self._synthesize(plain_text)
             
             return {
                 'success': True,
@@ -190,13 +335,22 @@ class OpenAITTSProvider(AudioProvider):
             return {
                 'success': False,
                 'error': str(e),
-                'provider': 'openai'
+                'provider': 'openai',
+                'retryable': is_retryable(e)
             }
     
+    async def _synthesize(self, text: str) -> bytes:
+        """Synthesize one request's worth of text."""
+        response = await self.client.audio.speech.create(
+            model=self.config.get('model', 'tts-1'),
+            voice=self.config.get('voice', 'alloy'),
+            input=text,
+            speed=self.config.get('speed', 1.0)
+        )
+        return response.content
+    
     def _ssml_to_text(self, ssml: str) -> str:
         """Convert SSML to plain text."""
-        import re
-        
         try:
             # First, try to parse as XML
             root = ET.fromstring(ssml)
@@ -208,22 +362,20 @@ class OpenAITTSProvider(AudioProvider):
         
         # Clean up any remaining SSML artifacts
         # Remove all XML tags completely
-        text_content = re.sub(r'<[^>]+>', '', text_content)
+        text_content = _TAG_RE.sub('', text_content)
         
         # Remove any SSML-specific attributes that might leak through
-        text_content = re.sub(r'\b(rate|pitch|volume|prosody|emphasis|break)\s*[=:]\s*["\']?[^"\'\s]+["\']?', '', text_content, flags=re.IGNORECASE)
+        text_content = _SSML_ATTR_RE.sub('', text_content)
         
         # Remove any remaining SSML instruction words
-        ssml_words = ['rate', 'pitch', 'volume', 'high', 'low', 'medium', 'fast', 'slow', 'soft', 'loud', 'prosody', 'emphasis', 'break']
-        for word in ssml_words:
-            text_content = re.sub(rf'\b{word}\b', '', text_content, flags=re.IGNORECASE)
+        text_content = _SSML_WORDS_RE.sub('', text_content)
         
         # Clean up extra whitespace and punctuation
-        text_content = re.sub(r'\s+', ' ', text_content)
-        text_content = re.sub(r'\s*,\s*', ', ', text_content)  # Fix comma spacing
-        text_content = re.sub(r'\s*\.\s*', '. ', text_content)  # Fix period spacing
-        text_content = re.sub(r'\s*!\s*', '! ', text_content)   # Fix exclamation spacing
-        text_content = re.sub(r'\s*\?\s*', '? ', text_content)  # Fix question spacing
+        text_content = _WHITESPACE_RE.sub(' ', text_content)
+        text_content = _COMMA_RE.sub(', ', text_content)  # Fix comma spacing
+        text_content = _PERIOD_RE.sub('. ', text_content)  # Fix period spacing
+        text_content = _EXCLAMATION_RE.sub('! ', text_content)  # Fix exclamation spacing
+        text_content = _QUESTION_RE.sub('? ', text_content)  # Fix question spacing
         
         # Final cleanup
         text_content = text_content.strip()
@@ -248,7 +400,9 @@ class ElevenLabsProvider(AudioProvider):
             self.client = None
             logger.warning("ElevenLabs API key not found or package not installed")
     
-    async def generate_audio(self, ssml: str, scene_number: int) -> Dict[str, Any]:
+    async def generate_audio(self, ssml: str, scene_number: int,
+                             plain_text: Optional[str] = None,
+                             audio_path: Optional[Path] = None) -> Dict[str, Any]:
         """Generate audio using ElevenLabs API."""
         if not self.client:
             return {
@@ -260,7 +414,8 @@ class ElevenLabsProvider(AudioProvider):
         try:
             # Convert SSML to plain text for ElevenLabs (they don't support SSML directly)
             # We'll use voice settings to simulate emotional tones
-            plain_text = self._ssml_to_text(ssml)
+            if plain_text is None:
+                plain_text = self._ssml_to_text(ssml)
             
             # Generate voice settings based on content analysis
             voice_settings = self._analyze_and_adjust_voice_settings(plain_text)
@@ -278,10 +433,11 @@ class ElevenLabsProvider(AudioProvider):
                 }
             )
             
-            # Collect audio data
-            audio_data = b""
+            # Collect audio data (joined once instead of growing a bytes object per chunk)
+            chunks = []
             async for chunk in audio_generator:
-                audio_data += chunk
+                chunks.append(chunk)
+            audio_data = b"".join(chunks)
             
             return {
                 'success': True,
@@ -295,7 +451,8 @@ class ElevenLabsProvider(AudioProvider):
             return {
                 'success': False,
                 'error': str(e),
-                'provider': 'elevenlabs'
+                'provider': 'elevenlabs',
+                'retryable': is_retryable(e)
             }
     
     def _ssml_to_text(self, ssml: str) -> str:
@@ -306,21 +463,19 @@ class ElevenLabsProvider(AudioProvider):
             text_content = ''.join(root.itertext())
             
             # Clean up any remaining SSML artifacts
-            import re
             # Remove any remaining XML tags
-            text_content = re.sub(r'<[^>]+>', '', text_content)
+            text_content = _TAG_RE.sub('', text_content)
             # Clean up extra whitespace
-            text_content = re.sub(r'\s+', ' ', text_content).strip()
+            text_content = _WHITESPACE_RE.sub(' ', text_content).strip()
             
             return text_content
         except ET.ParseError as e:
             logger.warning(f"SSML parsing failed: {e}, using fallback text extraction")
             # Fallback: use regex to extract text between tags
-            import re
             # Remove all XML tags
-            text_content = re.sub(r'<[^>]+>', '', ssml)
+            text_content = _TAG_RE.sub('', ssml)
             # Clean up extra whitespace
-            text_content = re.sub(r'\s+', ' ', text_content).strip()
+            text_content = _WHITESPACE_RE.sub(' ', text_content).strip()
             return text_content
         except Exception as e:
             logger.error(f"Unexpected error in SSML to text conversion: {e}")
@@ -357,13 +512,70 @@ class ElevenLabsProvider(AudioProvider):
 class AzureTTSProvider(AudioProvider):
     """Azure Text-to-Speech provider with native SSML support."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any],
+                 connector_factory: Optional[Callable[[], aiohttp.BaseConnector]] = None):
         super().__init__(config)
         self.api_key = os.getenv('AZURE_SPEECH_KEY')
         self.region = os.getenv('AZURE_SPEECH_REGION')
         self.voice_name = config.get('voice_name', 'en-US-AriaNeural')
+        self._connector_factory = connector_factory
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # With h2 installed, concurrent scenes multiplex over one HTTP/2 connection
+        self.http2 = config.get('http2', True) and HTTPX_AVAILABLE and HTTP2_AVAILABLE
+        self._client = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            if self._connector_factory is not None:
+                # Connection pool is owned by the AudioGenerator and shared across providers
+                connector, connector_owner = self._connector_factory(), False
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit=32, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=60
+                )
+                connector_owner = True
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=connector_owner,
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+        return self._session
+    
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Return the HTTP/2 client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=60.0,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            )
+        return self._client
     
-    async def generate_audio(self, ssml: str, scene_number: int) -> Dict[str, Any]:
+    @asynccontextmanager
+    async def _post(self, endpoint: str, headers: Dict[str, str],
+                    body: bytes) -> AsyncIterator[Tuple[int, Any, AsyncIterable[bytes]]]:
+        """POST a request and yield its status, headers and streamed body."""
+        if self.http2:
+            async with self._get_client().stream('POST', endpoint, headers=headers, content=body) as response:
+                yield response.status_code, response.headers, response.aiter_bytes(_STREAM_CHUNK_SIZE)
+        else:
+            async with self._get_session().post(endpoint, headers=headers, data=body) as response:
+                yield response.status, response.headers, response.content.iter_chunked(_STREAM_CHUNK_SIZE)
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def generate_audio(self, ssml: str, scene_number: int,
+                             plain_text: Optional[str] = None,
+                             audio_path: Optional[Path] = None) -> Dict[str, Any]:
         """Generate audio using Azure TTS with SSML support."""
         if not self.api_key or not self.region:
             return {
@@ -389,30 +601,37 @@ class AzureTTSProvider(AudioProvider):
                 'X-Microsoft-OutputFormat': 'audio-16khz-128kbitrate-mono-mp3'
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(endpoint, headers=headers, data=full_ssml.encode('utf-8')) as response:
-                    if response.status == 200:
-                        audio_data = await response.read()
-                        return {
-                            'success': True,
-                            'audio_data': audio_data,
-                            'provider': 'azure',
-                            'voice_name': self.voice_name
-                        }
+            async with self._post(endpoint, headers, full_ssml.encode('utf-8')) as (status, response_headers, chunks):
+                if status == 200:
+                    result = {
+                        'success': True,
+                        'provider': 'azure',
+                        'voice_name': self.voice_name
+                    }
+                    if audio_path is not None:
+                        # Write chunks as they arrive instead of buffering the whole MP3
+                        await atomic_write_stream(audio_path, chunks)
+                        result['audio_path'] = audio_path
                     else:
-                        error_text = await response.text()
-                        return {
-                            'success': False,
-                            'error': f"Azure TTS error: {response.status} - {error_text}",
-                            'provider': 'azure'
-                        }
+                        result['audio_data'] = b"".join([chunk async for chunk in chunks])
+                    return result
+                else:
+                    error_text = b"".join([chunk async for chunk in chunks]).decode('utf-8', errors='replace')
+                    return {
+                        'success': False,
+                        'error': f"Azure TTS error: {status} - {error_text}",
+                        'provider': 'azure',
+                        'retryable': status in RETRYABLE_STATUS,
+                        'retry_after': retry_after(response_headers.get('Retry-After'))
+                    }
         
         except Exception as e:
             logger.error(f"Azure TTS generation failed: {str(e)}")
             return {
                 'success': False,
                 'error': str(e),
-                'provider': 'azure'
+                'provider': 'azure',
+                'retryable': is_retryable(e)
             }
 
 
@@ -427,11 +646,34 @@ class AudioGenerator:
         # Initialize providers
         self.providers = self._initialize_providers()
         
+        # Content-addressed cache of synthesized audio; keys include the voice settings
+        audio_config = self.config.get('audio_generation', {})
+        self.tts_cache_enabled = audio_config.get('tts_cache', True)
+        self.tts_cache_dir = self.output_dir / '.tts_cache'
+        self._tts_settings = json.dumps(
+            {name: audio_config.get(name) for name in _TTS_OUTPUT_SETTINGS},
+            sort_keys=True, default=str
+        )
+        
+        # Transient provider failures are retried before falling back to the next provider
+        self.max_retries = audio_config.get('max_retries', 3)
+        requests_per_minute = audio_config.get('requests_per_minute')
+        self._rate_limiters = {
+            name: _RateLimiter(requests_per_minute) for name in self.providers
+        } if requests_per_minute else {}
+        
+        # One aiohttp connection pool for every provider session, created on first use
+        self._shared_connector: Optional[aiohttp.TCPConnector] = None
+        
+        # Synthesis requests in flight, so identical scenes share one provider call
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        
         # Generation statistics
         self.stats = {
             'total_generated': 0,
             'successful_generations': 0,
             'failed_generations': 0,
+            'cache_hits': 0,
             'total_audio_duration': 0,
             'provider_usage': {}
         }
@@ -453,10 +695,32 @@ class AudioGenerator:
         
         # Initialize Azure TTS provider
         if primary_provider == 'azure' or 'azure' in audio_config.get('fallback_providers', []):
-            providers['azure'] = AzureTTSProvider(audio_config)
+            providers['azure'] = AzureTTSProvider(audio_config, connector_factory=self._get_connector)
         
         return providers
     
+    def _get_connector(self) -> aiohttp.TCPConnector:
+        """Return the shared connection pool, creating it inside the running loop."""
+        if self._shared_connector is None or self._shared_connector.closed:
+            self._shared_connector = aiohttp.TCPConnector(
+                limit=64, limit_per_host=16, ttl_dns_cache=300,
+                keepalive_timeout=75, enable_cleanup_closed=True
+            )
+        return self._shared_connector
+    
+    async def aclose(self) -> None:
+        """Close the providers' network sessions and the shared connection pool."""
+        await asyncio.gather(*(provider.aclose() for provider in self.providers.values()))
+        if self._shared_connector is not None:
+            await self._shared_connector.close()
+            self._shared_connector = None
+    
+    async def __aenter__(self) -> "AudioGenerator":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
     async def generate_scene_audio(self, scene: StoryScene, 
                                  story_title: str = "story") -> AssetGenerationStatus:
         """Generate audio for a single scene."""
@@ -466,6 +730,7 @@ class AudioGenerator:
             # Build SSML from narration and tones
             ssml = SSMLBuilder.build_ssml(scene.narration_text, scene.narration_tones)
             ssml = SSMLBuilder.add_pauses_and_breaks(ssml, scene.scene_number)
+            plain_text = SSMLBuilder.build_plain_text(scene.narration_text)
             
             # Determine provider order
             primary_provider = self.config.get('audio_generation', {}).get('primary_provider', 'openai')
@@ -480,8 +745,7 @@ class AudioGenerator:
                 
                 logger.info(f"Generating audio for scene {scene.scene_number} using {provider_name}")
                 
-                provider = self.providers[provider_name]
-                result = await provider.generate_audio(ssml, scene.scene_number)
+                result = await self._synthesize(provider_name, ssml, plain_text, scene.scene_number)
                 
                 if result['success']:
                     # Save the audio
@@ -519,20 +783,109 @@ class AudioGenerator:
                 error_message=str(e)
             )
     
+    async def _synthesize(self, provider_name: str, ssml: str, plain_text: str,
+                          scene_number: int) -> Dict[str, Any]:
+        """Synthesize audio, sharing the provider call between identical concurrent requests."""
+        key = (provider_name, ssml, plain_text)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._synthesize_cached(provider_name, ssml, plain_text, scene_number)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info(f"Sharing in-flight {provider_name} audio for scene {scene_number}")
+        
+        # Shielded so a cancelled scene does not cancel the call for the others
+        return await asyncio.shield(task)
+    
+    async def _synthesize_cached(self, provider_name: str, ssml: str, plain_text: str,
+                                 scene_number: int) -> Dict[str, Any]:
+        """Synthesize audio through the on-disk cache."""
+        cache_path = self._tts_cache_path(provider_name, ssml, plain_text)
+        result = await self._load_cached_audio(cache_path, provider_name)
+        if result is None:
+            if cache_path is not None:
+                ensure_dir(self.tts_cache_dir)
+            # Streaming providers write straight into the cache file
+            result = await self._call_provider(provider_name, ssml, plain_text, scene_number, cache_path)
+            if result['success']:
+                await self._store_cached_audio(cache_path, result)
+        return result
+    
+    async def _call_provider(self, provider_name: str, ssml: str, plain_text: str,
+                             scene_number: int, audio_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Call a provider, retrying transient failures with exponential backoff."""
+        provider = self.providers[provider_name]
+        limiter = self._rate_limiters.get(provider_name)
+        
+        for attempt in range(self.max_retries + 1):
+            if limiter is not None:
+                await limiter.acquire()
+            
+            result = await provider.generate_audio(ssml, scene_number, plain_text, audio_path)
+            if result['success'] or not result.get('retryable') or attempt == self.max_retries:
+                return result
+            
+            # Honour the provider's Retry-After, otherwise back off exponentially with jitter
+            delay = result.get('retry_after') or backoff_delay(attempt)
+            logger.warning(
+                f"{provider_name} TTS failed transiently for scene {scene_number} "
+                f"(attempt {attempt + 1}), retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+        
+        return result
+    
+    def _tts_cache_path(self, provider_name: str, ssml: str, plain_text: str) -> Optional[Path]:
+        """Return the cache file for a synthesis request, or None if caching is off."""
+        if not self.tts_cache_enabled:
+            return None
+        key_source = '\0'.join((provider_name, self._tts_settings, ssml, plain_text))
+        return self.tts_cache_dir / f"{hashlib.sha256(key_source.encode('utf-8')).hexdigest()}.mp3"
+    
+    async def _load_cached_audio(self, cache_path: Optional[Path],
+                                 provider_name: str) -> Optional[Dict[str, Any]]:
+        """Return a provider-style result for cached audio, or None on a miss."""
+        if cache_path is None or not await asyncio.to_thread(cache_path.is_file):
+            return None
+        
+        self.stats['cache_hits'] += 1
+        logger.info(f"Reusing cached {provider_name} audio")
+        return {
+            'success': True,
+            'audio_path': cache_path,
+            'provider': provider_name,
+            'cached': True
+        }
+    
+    async def _store_cached_audio(self, cache_path: Optional[Path], result: Dict[str, Any]) -> None:
+        """Persist synthesized audio to the cache (failures only cost a future miss)."""
+        if cache_path is None or not result.get('audio_data'):
+            return
+        try:
+            await asyncio.to_thread(atomic_write_bytes, cache_path, result['audio_data'])
+        except OSError as e:
+            logger.warning(f"Could not cache audio: {e}")
+    
     async def _save_audio(self, result: Dict[str, Any], scene_number: int, 
                          story_title: str) -> Optional[Path]:
         """Save generated audio to file."""
         try:
-            story_dir = self.output_dir / story_title
-            story_dir.mkdir(exist_ok=True)
+            story_dir = ensure_dir(self.output_dir / story_title)
             
             audio_filename = f"scene_{scene_number:02d}.mp3"
             audio_path = story_dir / audio_filename
             
+            # Write off the event loop so other scenes keep generating
+            if result.get('audio_path'):
+                await asyncio.to_thread(atomic_copy, result['audio_path'], audio_path)
+                return audio_path
+            
             audio_data = result.get('audio_data')
             if audio_data:
-                with open(audio_path, 'wb') as f:
-                    f.write(audio_data)
+                await asyncio.to_thread(atomic_write_bytes, audio_path, audio_data)
                 return audio_path
             
             return None
@@ -545,29 +898,47 @@ class AudioGenerator:
                                  story_title: str = "story",
                                  max_concurrent: int = 2) -> List[AssetGenerationStatus]:
         """Generate audio for all scenes in a story."""
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def generate_single(scene: StoryScene) -> AssetGenerationStatus:
-            async with semaphore:
-                return await self.generate_scene_audio(scene, story_title)
-        
-        tasks = [generate_single(scene) for scene in scenes]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle exceptions
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append(AssetGenerationStatus(
-                    scene_number=scenes[i].scene_number,
-                    audio_generated=False,
-                    error_message=str(result)
-                ))
-            else:
-                processed_results.append(result)
-        
+        processed_results: List[Optional[AssetGenerationStatus]] = [None] * len(scenes)
+        async for index, status in self._iter_scene_audio(scenes, story_title, max_concurrent):
+            processed_results[index] = status
         return processed_results
     
+    async def iter_story_audio(self, scenes: List[StoryScene],
+                               story_title: str = "story",
+                               max_concurrent: int = 2) -> AsyncIterator[AssetGenerationStatus]:
+        """Yield scene audio statuses as soon as each scene finishes."""
+        async for _, status in self._iter_scene_audio(scenes, story_title, max_concurrent):
+            yield status
+    
+    async def _iter_scene_audio(self, scenes: List[StoryScene], story_title: str,
+                                max_concurrent: int) -> AsyncIterator[Tuple[int, AssetGenerationStatus]]:
+        """Generate scenes with a bounded worker pool, yielding (index, status) in completion order."""
+        pending: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(scenes):
+            pending.put_nowait(item)
+        finished: asyncio.Queue = asyncio.Queue()
+        
+        async def worker() -> None:
+            while not pending.empty():
+                index, scene = pending.get_nowait()
+                try:
+                    status = await self.generate_scene_audio(scene, story_title)
+                except Exception as e:
+                    status = AssetGenerationStatus(
+                        scene_number=scene.scene_number,
+                        audio_generated=False,
+                        error_message=str(e)
+                    )
+                finished.put_nowait((index, status))
+        
+        workers = [asyncio.create_task(worker()) for _ in range(min(max(1, max_concurrent), len(scenes)))]
+        try:
+            for _ in range(len(scenes)):
+                yield await finished.get()
+        finally:
+            for task in workers:
+                task.cancel()
+    
     def preview_ssml(self, scene: StoryScene) -> str:
         """Preview the SSML that would be generated for a scene."""
         ssml = SSMLBuilder.build_ssml(scene.narration_text, scene.narration_tones)
@@ -575,31 +946,26 @@ class AudioGenerator:
     
     def get_generation_stats(self) -> Dict[str, Any]:
         """Get audio generation statistics."""
-        stats = self.stats.copy()
-        if stats['total_generated'] > 0:
-            stats['success_rate'] = stats['successful_generations'] / stats['total_generated']
-        else:
-            stats['success_rate'] = 0
-        
-        return stats
+        total = self.stats['total_generated']
+        success_rate = self.stats['successful_generations'] / total if total > 0 else 0
+        return {**self.stats, 'success_rate': success_rate}
     
     async def health_check(self) -> Dict[str, Any]:
         """Check health of audio generation providers."""
-        health_status = {}
-        
         test_ssml = "<speak>This is a test audio generation.</speak>"
         
-        for provider_name, provider in self.providers.items():
-            try:
-                result = await provider.generate_audio(test_ssml, 1)
-                health_status[provider_name] = {
-                    'status': 'healthy' if result['success'] else 'unhealthy',
-                    'error': result.get('error', None)
-                }
-            except Exception as e:
-                health_status[provider_name] = {
-                    'status': 'unhealthy',
-                    'error': str(e)
-                }
-        
-        return health_status
+        # Providers are independent endpoints, so probe them concurrently
+        names = list(self.providers)
+        results = await asyncio.gather(
+            *(provider.generate_audio(test_ssml, 1) for provider in self.providers.values()),
+            return_exceptions=True
+        )
+        
+        return {
+            name: {'status': 'unhealthy', 'error': str(result)}
+            if isinstance(result, Exception) else {
+                'status': 'healthy' if result['success'] else 'unhealthy',
+                'error': result.get('error', None)
+            }
+            for name, result in zip(names, results)
+        }
@@ -4,53 +4,69 @@ import os
 import asyncio
 import aiohttp
 import base64
-from typing import Optional, Dict, Any, List
+import hashlib
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 import logging
-from PIL import Image
-import io
 
 import openai
-from dotenv import load_dotenv
 
+from ..core.config import load_env
+from ..core.file_utils import atomic_copy, atomic_write_bytes, atomic_write_stream, ensure_dir
+from ..core.retry import RETRYABLE_STATUS, backoff_delay, is_retryable, retry_after
 from ..core.models import StoryScene, AssetGenerationStatus
 
-load_dotenv()
+load_env()
 logger = logging.getLogger(__name__)
 
 
+def _write_base64_image(path: Path, data: str) -> None:
+    """Decode base64 image data and write it atomically."""
+    atomic_write_bytes(path, base64.b64decode(data))
+
+
 class ImageProvider:
     """Base class for image generation providers."""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
     
-    async def generate_image(self, prompt: str, scene_number: int) -> Dict[str, Any]:
-        """Generate an image from a text prompt."""
+    async def generate_image(self, prompt: str, scene_number: int,
+                             image_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Generate an image from a text prompt.
+        
+        Providers that return raw image bytes may write straight to
+        image_path and return it in place of the image data.
+        """
+        raise NotImplementedError
+    
+    async def health_probe(self) -> Dict[str, Any]:
+        """Check the provider is reachable and authorized without generating an image."""
         raise NotImplementedError
+    
+    async def aclose(self) -> None:
+        """Release network resources held by the provider."""
 
 
 class OpenAIImageProvider(ImageProvider):
     """OpenAI DALL-E image generation provider."""
     
+    # Style consistency markers appended to every prompt
+    _STYLE_SUFFIX = " --style consistent children's book illustration, same artistic style throughout, cohesive visual narrative, consistent character designs"
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.client = openai.AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
     
-    async def generate_image(self, prompt: str, scene_number: int) -> Dict[str, Any]:
+    async def generate_image(self, prompt: str, scene_number: int,
+                             image_path: Optional[Path] = None) -> Dict[str, Any]:
         """Generate image using DALL-E."""
         try:
             # Enhance prompt for consistency
             enhanced_prompt = self._enhance_prompt_for_consistency(prompt, scene_number)
             
-            response = await self.client.images.generate(
-                model=self.config.get('model', 'dall-e-3'),
-                prompt=enhanced_prompt,
-                size=self.config.get('size', '1024x1024'),
-                quality=self.config.get('quality', 'hd'),
-                style=self.config.get('style', 'natural'),
-                n=1
-            )
+            response = await self.client.images.generate(**self._build_request(enhanced_prompt))
             
             image_url = response.data[0].url
             revised_prompt = response.data[0].revised_prompt
@@ -68,31 +84,153 @@ class OpenAIImageProvider(ImageProvider):
             return {
                 'success': False,
                 'error': str(e),
-                'provider': 'openai'
+                'provider': 'openai',
+                'retryable': is_retryable(e)
+            }
+    
+    async def health_probe(self) -> Dict[str, Any]:
+        """List models as a free check of the API key and connectivity."""
+        try:
+            await self.client.models.list()
+            return {'success': True, 'provider': 'openai'}
+        except Exception as e:
+            return {'success': False, 'error': str(e), 'provider': 'openai'}
+    
+    async def generate_images_batch(self, prompts: Dict[int, str],
+                                    poll_interval: float = 30.0) -> Dict[int, Dict[str, Any]]:
+        """Generate images for several scenes through a single Batch API job.
+        
+        Batch jobs trade latency for cost, so this is meant for offline
+        compilation of long stories. Scenes missing from the returned
+        mapping were not produced and should be retried in real time.
+        """
+        lines = [
+            json.dumps({
+                'custom_id': f"scene_{scene_number}",
+                'method': 'POST',
+                'url': '/v1/images/generations',
+                'body': self._build_request(
+                    self._enhance_prompt_for_consistency(prompt, scene_number)
+                )
+            })
+            for scene_number, prompt in prompts.items()
+        ]
+        
+        batch_file = await self.client.files.create(
+            file=('scenes.jsonl', '\n'.join(lines).encode('utf-8')),
+            purpose='batch'
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint='/v1/images/generations',
+            completion_window='24h'
+        )
+        logger.info(f"Submitted image batch {batch.id} with {len(lines)} scenes")
+        
+        while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            await asyncio.sleep(poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+        
+        results = {}
+        if not batch.output_file_id:
+            logger.warning(f"Image batch {batch.id} finished with status {batch.status} and no output")
+            return results
+        
+        output = await self.client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get('response') or {}
+            if response.get('status_code') != 200:
+                continue
+            
+            image = response['body']['data'][0]
+            scene_number = int(entry['custom_id'].rsplit('_', 1)[1])
+            result = {
+                'success': True,
+                'revised_prompt': image.get('revised_prompt'),
+                'provider': 'openai',
+                'model': self.config.get('model', 'dall-e-3')
             }
+            if image.get('b64_json'):
+                result['image_data'] = image['b64_json']
+            else:
+                result['image_url'] = image.get('url')
+            results[scene_number] = result
+        
+        return results
+    
+    def _build_request(self, prompt: str) -> Dict[str, Any]:
+        """Build the image generation request body."""
+        return {
+            'model': self.config.get('model', 'dall-e-3'),
+            'prompt': prompt,
+            'size': self.config.get('size', '1024x1024'),
+            'quality': self.config.get('quality', 'hd'),
+            'style': self.config.get('style', 'natural'),
+            'n': 1
+        }
     
     def _enhance_prompt_for_consistency(self, prompt: str, scene_number: int) -> str:
         """Enhance prompt to maintain visual consistency across scenes."""
-        # Add style consistency markers
-        style_suffix = " --style consistent children's book illustration, same artistic style throughout, cohesive visual narrative, consistent character designs"
-        
-        # Add scene context for continuity
+        # Add scene context for continuity, and style consistency markers
         if scene_number > 1:
-            continuity_prefix = f"Scene {scene_number} in the same visual style as previous scenes. "
-            prompt = continuity_prefix + prompt
-        
-        return prompt + style_suffix
+            return f"Scene {scene_number} in the same visual style as previous scenes. {prompt}{self._STYLE_SUFFIX}"
+        return f"{prompt}{self._STYLE_SUFFIX}"
 
 
 class StabilityImageProvider(ImageProvider):
     """Stability AI image generation provider."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any],
+                 session_factory: Optional[Callable[[], aiohttp.ClientSession]] = None):
         super().__init__(config)
         self.api_key = os.getenv('STABILITY_API_KEY')
         self.base_url = "https://api.stability.ai/v1/generation/stable-diffusion-xl-1024-v1-0/text-to-image"
+        self.account_url = "https://api.stability.ai/v1/user/account"
+        self._session_factory = session_factory
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it on first use."""
+        if self._session_factory is not None:
+            # Session is owned by the ImageGenerator and shared with image downloads
+            return self._session_factory()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=10, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=120, connect=10)
+            )
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
     
-    async def generate_image(self, prompt: str, scene_number: int) -> Dict[str, Any]:
+    async def health_probe(self) -> Dict[str, Any]:
+        """Fetch the account as a free check of the API key and connectivity."""
+        if not self.api_key:
+            return {'success': False, 'error': 'Stability AI API key not found', 'provider': 'stability'}
+        
+        try:
+            headers = {"Authorization": f"Bearer {self.api_key}"}
+            async with self._get_session().get(self.account_url, headers=headers) as response:
+                if response.status == 200:
+                    return {'success': True, 'provider': 'stability'}
+                error_data = await response.text()
+                return {
+                    'success': False,
+                    'error': f"API error: {response.status} - {error_data}",
+                    'provider': 'stability'
+                }
+        except Exception as e:
+            return {'success': False, 'error': str(e), 'provider': 'stability'}
+    
+    async def generate_image(self, prompt: str, scene_number: int,
+                             image_path: Optional[Path] = None) -> Dict[str, Any]:
         """Generate image using Stability AI."""
         if not self.api_key:
             return {
@@ -105,7 +243,8 @@ class StabilityImageProvider(ImageProvider):
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
-                "Accept": "application/json"
+                # Raw PNG bytes rather than base64 wrapped in JSON
+                "Accept": "image/png"
             }
             
             payload = {
@@ -123,48 +262,89 @@ class StabilityImageProvider(ImageProvider):
                 "style_preset": "digital-art"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.base_url, headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Extract base64 image data
-                        image_data = data['artifacts'][0]['base64']
-                        
-                        return {
-                            'success': True,
-                            'image_data': image_data,
-                            'provider': 'stability',
-                            'model': 'stable-diffusion-xl'
-                        }
+            async with self._get_session().post(self.base_url, headers=headers, json=payload) as response:
+                if response.status == 200:
+                    result = {
+                        'success': True,
+                        'provider': 'stability',
+                        'model': 'stable-diffusion-xl'
+                    }
+                    if image_path is not None:
+                        # Write chunks as they arrive instead of buffering the whole image
+                        await atomic_write_stream(image_path, response.content.iter_chunked(64 * 1024))
+                        result['image_path'] = image_path
                     else:
-                        error_data = await response.text()
-                        return {
-                            'success': False,
-                            'error': f"API error: {response.status} - {error_data}",
-                            'provider': 'stability'
-                        }
+                        result['image_bytes'] = await response.read()
+                    return result
+                else:
+                    error_data = await response.text()
+                    return {
+                        'success': False,
+                        'error': f"API error: {response.status} - {error_data}",
+                        'provider': 'stability',
+                        'retryable': response.status in RETRYABLE_STATUS,
+                        'retry_after': retry_after(response.headers.get('Retry-After'))
+                    }
         
         except Exception as e:
             logger.error(f"Stability AI generation failed: {str(e)}")
             return {
                 'success': False,
                 'error': str(e),
-                'provider': 'stability'
+                'provider': 'stability',
+                'retryable': is_retryable(e)
             }
 
 
 class ImageGenerator:
     """Main image generation orchestrator with multiple providers."""
     
+    # Style keywords recognised in visual descriptions, in priority order per category
+    STYLE_KEYWORDS = {
+        'art_style': ['watercolor', 'digital art', 'oil painting', 'illustration'],
+        'lighting': ['golden hour', 'soft light', 'dramatic lighting', 'moonlight'],
+        'mood': ['whimsical', 'mysterious', 'bright', 'dark', 'cheerful'],
+        'color_palette': ['warm colors', 'cool colors', 'pastel', 'vibrant']
+    }
+    
     def __init__(self, config: Dict[str, Any], output_dir: str = "./generated_stories"):
         self.config = config
+        self.image_config = config.get('image_generation') or {}
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
+        # One pooled HTTP session for provider calls and image downloads, created on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        
         # Initialize providers
         self.providers = self._initialize_providers()
         
+        # Primary provider first, then fallbacks; only providers that were initialized
+        image_config = self.image_config
+        self._provider_order = tuple(
+            name for name in dict.fromkeys([
+                image_config.get('primary_provider', 'openai'), *image_config.get('fallback_providers', [])
+            ])
+            if name in self.providers
+        )
+        
+        # Transient provider failures are retried before falling back to the next provider
+        self.max_retries = image_config.get('max_retries', 3)
+        
+        # Bounds provider requests across all scenes and stories; downloads,
+        # saves and retry backoff do not hold a slot
+        self._request_semaphore = asyncio.Semaphore(image_config.get(
+            'max_concurrent', self.config.get('performance', {}).get('max_concurrent_generations', 3)
+        ))
+        
+        # Content-addressed cache of generated images; keys include the image settings
+        self.image_cache_enabled = image_config.get('image_cache', True)
+        self.image_cache_dir = self.output_dir / '.image_cache'
+        self._image_settings = json.dumps(
+            {key: image_config.get(key) for key in ('model', 'size', 'quality', 'style')},
+            sort_keys=True
+        )
+        
         # Character consistency tracking
         self.character_descriptions = {}
         self.style_guide = {}
@@ -175,14 +355,21 @@ class ImageGenerator:
             'total_generated': 0,
             'successful_generations': 0,
             'failed_generations': 0,
+            'cache_hits': 0,
             'provider_usage': {}
         }
     
+    def reset_story_state(self, character_descriptions: Optional[Dict[str, str]] = None) -> None:
+        """Start a new story, forgetting the characters and scenes of earlier ones."""
+        self.character_descriptions = dict(character_descriptions or {})
+        self.style_guide = {}
+        self.generated_scenes = []
+    
     def _initialize_providers(self) -> Dict[str, ImageProvider]:
         """Initialize image generation providers."""
         providers = {}
         
-        image_config = self.config.get('image_generation', {})
+        image_config = self.image_config
         primary_provider = image_config.get('primary_provider', 'openai')
         
         # Initialize OpenAI provider
@@ -191,10 +378,34 @@ class ImageGenerator:
         
         # Initialize Stability AI provider
         if primary_provider == 'stability' or 'stability' in image_config.get('fallback_providers', []):
-            providers['stability'] = StabilityImageProvider(image_config)
+            providers['stability'] = StabilityImageProvider(image_config, session_factory=self._get_session)
         
         return providers
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it inside the running loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=10, ttl_dns_cache=300, enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=120, connect=10)
+            )
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the providers' network sessions and the shared HTTP session."""
+        await asyncio.gather(*(provider.aclose() for provider in self.providers.values()))
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self) -> "ImageGenerator":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
     def _extract_character_descriptions(self, scene: StoryScene) -> Dict[str, str]:
         """Extract character descriptions from scene text."""
         characters = {}
@@ -244,9 +455,10 @@ class ImageGenerator:
                 character_consistency += f"- {char_name}: {desc}\n"
             character_consistency += "DO NOT change any character's appearance, clothing, or features. "
         
-        # Build style consistency
+        # Build style consistency (by scene position, not completion order, so
+        # concurrently built prompts and their cache keys are deterministic)
         style_consistency = ""
-        if self.generated_scenes:
+        if scene.scene_number > 1:
             style_consistency = "Maintain exact same artistic style, color palette, and visual treatment as previous scenes. "
         
         # Scene continuity
@@ -271,21 +483,19 @@ class ImageGenerator:
             # Build consistency-enhanced prompt
             enhanced_prompt = self._build_consistency_prompt(scene, scene.visual_description)
             
-            # Determine provider order
-            primary_provider = self.config.get('image_generation', {}).get('primary_provider', 'openai')
-            fallback_providers = self.config.get('image_generation', {}).get('fallback_providers', [])
-            
-            providers_to_try = [primary_provider] + [p for p in fallback_providers if p != primary_provider]
-            
             # Attempt generation with fallback
-            for provider_name in providers_to_try:
-                if provider_name not in self.providers:
-                    continue
-                
+            for provider_name in self._provider_order:
                 logger.info(f"Generating image for scene {scene.scene_number} using {provider_name}")
                 
-                provider = self.providers[provider_name]
-                result = await provider.generate_image(enhanced_prompt, scene.scene_number)
+                cache_path = self._image_cache_path(provider_name, enhanced_prompt)
+                result = await self._load_cached_image(cache_path, provider_name)
+                if result is None:
+                    if cache_path is not None:
+                        ensure_dir(self.image_cache_dir)
+                    # Streaming providers write straight into the cache file
+                    result = await self._call_provider(
+                        provider_name, enhanced_prompt, scene.scene_number, cache_path
+                    )
                 
                 if result['success']:
                     # Save the image
@@ -294,6 +504,9 @@ class ImageGenerator:
                     )
                     
                     if image_path:
+                        if 'image_path' not in result:
+                            await self._store_cached_image(cache_path, image_path)
+                        
                         self.stats['successful_generations'] += 1
                         self.stats['provider_usage'][provider_name] = \
                             self.stats['provider_usage'].get(provider_name, 0) + 1
@@ -330,31 +543,89 @@ class ImageGenerator:
                 error_message=str(e)
             )
     
+    async def _call_provider(self, provider_name: str, prompt: str, scene_number: int,
+                             image_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Call a provider, retrying transient failures with exponential backoff."""
+        provider = self.providers[provider_name]
+        
+        for attempt in range(self.max_retries + 1):
+            async with self._request_semaphore:
+                result = await provider.generate_image(prompt, scene_number, image_path)
+            if result['success'] or not result.get('retryable') or attempt == self.max_retries:
+                return result
+            
+            # Honour the provider's Retry-After, otherwise back off exponentially with jitter
+            delay = result.get('retry_after') or backoff_delay(attempt)
+            logger.warning(
+                f"{provider_name} image generation failed transiently for scene {scene_number} "
+                f"(attempt {attempt + 1}), retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+        
+        return result
+    
+    def _image_cache_path(self, provider_name: str, prompt: str) -> Optional[Path]:
+        """Return the cache file for a generation request, or None if caching is off."""
+        if not self.image_cache_enabled:
+            return None
+        key_source = '\0'.join((provider_name, self._image_settings, prompt))
+        return self.image_cache_dir / f"{hashlib.sha256(key_source.encode('utf-8')).hexdigest()}.png"
+    
+    async def _load_cached_image(self, cache_path: Optional[Path],
+                                 provider_name: str) -> Optional[Dict[str, Any]]:
+        """Return a provider-style result for a cached image, or None on a miss."""
+        if cache_path is None or not cache_path.is_file():
+            return None
+        
+        self.stats['cache_hits'] += 1
+        logger.info(f"Reusing cached {provider_name} image")
+        return {
+            'success': True,
+            'image_path': cache_path,
+            'provider': provider_name,
+            'cached': True
+        }
+    
+    async def _store_cached_image(self, cache_path: Optional[Path], image_path: Path) -> None:
+        """Copy a saved image into the cache (failures only cost a future miss)."""
+        if cache_path is None:
+            return
+        try:
+            await asyncio.to_thread(atomic_copy, image_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache image: {e}")
+    
     async def _save_image(self, result: Dict[str, Any], scene_number: int, 
                          story_title: str) -> Optional[Path]:
         """Save generated image to file."""
         try:
-            story_dir = self.output_dir / story_title
-            story_dir.mkdir(exist_ok=True)
+            story_dir = ensure_dir(self.output_dir / story_title)
             
             image_filename = f"scene_{scene_number:02d}.png"
             image_path = story_dir / image_filename
             
-            if 'image_url' in result:
+            if 'image_path' in result:
+                # Copy from the image cache
+                await asyncio.to_thread(atomic_copy, result['image_path'], image_path)
+                return image_path
+            
+            elif 'image_url' in result:
                 # Download from URL (OpenAI)
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(result['image_url']) as response:
-                        if response.status == 200:
-                            image_data = await response.read()
-                            with open(image_path, 'wb') as f:
-                                f.write(image_data)
-                            return image_path
+                async with self._get_session().get(result['image_url']) as response:
+                    if response.status == 200:
+                        # Write chunks as they arrive instead of buffering the whole image
+                        await atomic_write_stream(image_path, response.content.iter_chunked(64 * 1024))
+                        return image_path
+            
+            elif 'image_bytes' in result:
+                # Save raw image bytes (Stability AI), off the event loop
+                await asyncio.to_thread(atomic_write_bytes, image_path, result['image_bytes'])
+                return image_path
             
             elif 'image_data' in result:
-                # Save from base64 data (Stability AI)
-                image_data = base64.b64decode(result['image_data'])
-                with open(image_path, 'wb') as f:
-                    f.write(image_data)
+                # Save from base64 data (OpenAI batch results); decode and write
+                # in one hop off the event loop
+                await asyncio.to_thread(_write_base64_image, image_path, result['image_data'])
                 return image_path
             
             return None
@@ -365,30 +636,147 @@ class ImageGenerator:
     
     async def generate_story_images(self, scenes: List[StoryScene], 
                                   story_title: str = "story",
-                                  max_concurrent: int = 3) -> List[AssetGenerationStatus]:
-        """Generate images for all scenes in a story."""
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def generate_single(scene: StoryScene) -> AssetGenerationStatus:
-            async with semaphore:
-                return await self.generate_scene_image(scene, story_title)
-        
-        tasks = [generate_single(scene) for scene in scenes]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle exceptions
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append(AssetGenerationStatus(
-                    scene_number=scenes[i].scene_number,
+                                  max_concurrent: Optional[int] = None) -> List[AssetGenerationStatus]:
+        """Generate images for all scenes in a story.
+        
+        All scenes start at once and provider requests are bounded by
+        image_generation.max_concurrent; max_concurrent additionally caps
+        the scenes in flight for this call.
+        """
+        processed_results: List[Optional[AssetGenerationStatus]] = [None] * len(scenes)
+        async for index, status in self._iter_scene_images(scenes, story_title, max_concurrent):
+            processed_results[index] = status
+        return processed_results
+    
+    async def iter_story_images(self, scenes: List[StoryScene],
+                                story_title: str = "story",
+                                max_concurrent: Optional[int] = None) -> AsyncIterator[AssetGenerationStatus]:
+        """Yield scene image statuses as soon as each scene finishes."""
+        async for _, status in self._iter_scene_images(scenes, story_title, max_concurrent):
+            yield status
+    
+    async def _iter_scene_images(self, scenes: List[StoryScene], story_title: str,
+                                 max_concurrent: Optional[int]) -> AsyncIterator[Tuple[int, AssetGenerationStatus]]:
+        """Generate each distinct description once, yielding (index, status) in completion order."""
+        # Scenes with identical descriptions share one generated image
+        groups: Dict[str, List[int]] = {}
+        for index, scene in enumerate(scenes):
+            groups.setdefault(scene.visual_description, []).append(index)
+        
+        semaphore = asyncio.Semaphore(max_concurrent or max(1, len(groups)))
+        
+        async def generate_group(indices: List[int]) -> List[Tuple[int, AssetGenerationStatus]]:
+            source = scenes[indices[0]]
+            try:
+                async with semaphore:
+                    status = await self.generate_scene_image(source, story_title)
+            except Exception as e:
+                status = AssetGenerationStatus(
+                    scene_number=source.scene_number,
                     image_generated=False,
-                    error_message=str(result)
-                ))
-            else:
-                processed_results.append(result)
+                    error_message=str(e)
+                )
+            
+            results = [(indices[0], status)]
+            for index in indices[1:]:
+                results.append((index, await self._reuse_scene_image(status, scenes[index], story_title)))
+            return results
         
-        return processed_results
+        tasks = [asyncio.create_task(generate_group(indices)) for indices in groups.values()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for item in await next_done:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _reuse_scene_image(self, status: AssetGenerationStatus, scene: StoryScene,
+                                 story_title: str) -> AssetGenerationStatus:
+        """Copy the image generated for an identical description to another scene."""
+        if not status.image_generated:
+            return AssetGenerationStatus(
+                scene_number=scene.scene_number,
+                image_generated=False,
+                error_message=status.error_message
+            )
+        
+        image_path = self.output_dir / story_title / f"scene_{scene.scene_number:02d}.png"
+        try:
+            await asyncio.to_thread(atomic_copy, status.image_path, image_path)
+        except OSError as e:
+            logger.error(f"Failed to reuse image for scene {scene.scene_number}: {str(e)}")
+            return AssetGenerationStatus(
+                scene_number=scene.scene_number,
+                image_generated=False,
+                error_message=str(e)
+            )
+        
+        logger.info(f"Reusing scene {status.scene_number} image for scene {scene.scene_number}")
+        self.stats['total_generated'] += 1
+        self.stats['successful_generations'] += 1
+        return AssetGenerationStatus(
+            scene_number=scene.scene_number,
+            image_generated=True,
+            image_path=str(image_path)
+        )
+    
+    async def generate_story_images_batch(self, scenes: List[StoryScene],
+                                        story_title: str = "story") -> List[AssetGenerationStatus]:
+        """Generate images for all scenes with a single OpenAI Batch API job.
+        
+        Scenes the batch could not produce fall back to the real-time path.
+        """
+        provider = self.providers.get('openai')
+        if not isinstance(provider, OpenAIImageProvider):
+            return await self.generate_story_images(scenes, story_title)
+        
+        batch_config = self.image_config.get('batch', {})
+        prompts = {
+            scene.scene_number: self._build_consistency_prompt(scene, scene.visual_description)
+            for scene in scenes
+        }
+        
+        try:
+            results = await provider.generate_images_batch(
+                prompts, poll_interval=batch_config.get('poll_interval_seconds', 30)
+            )
+        except Exception as e:
+            logger.warning(f"Image batch submission failed, using real-time generation: {e}")
+            return await self.generate_story_images(scenes, story_title)
+        
+        statuses = []
+        retry_scenes = []
+        for scene in scenes:
+            result = results.get(scene.scene_number)
+            image_path = None
+            if result:
+                image_path = await self._save_image(result, scene.scene_number, story_title)
+            
+            if not image_path:
+                retry_scenes.append(scene)
+                continue
+            
+            self.stats['total_generated'] += 1
+            self.stats['successful_generations'] += 1
+            self.stats['provider_usage']['openai'] = \
+                self.stats['provider_usage'].get('openai', 0) + 1
+            self.generated_scenes.append({
+                'scene_number': scene.scene_number,
+                'prompt': prompts[scene.scene_number],
+                'image_path': str(image_path)
+            })
+            statuses.append(AssetGenerationStatus(
+                scene_number=scene.scene_number,
+                image_generated=True,
+                image_path=str(image_path)
+            ))
+        
+        if retry_scenes:
+            logger.warning(f"Image batch missed {len(retry_scenes)} scenes, retrying in real time")
+            statuses.extend(await self.generate_story_images(retry_scenes, story_title))
+        
+        return sorted(statuses, key=lambda status: status.scene_number)
     
     def optimize_image_consistency(self, scenes: List[StoryScene]) -> List[StoryScene]:
         """Optimize visual descriptions for consistency across scenes."""
@@ -415,18 +803,12 @@ class ImageGenerator:
     
     def _extract_style_elements(self, description: str) -> Dict[str, str]:
         """Extract style elements from a visual description."""
-        # Simple keyword-based style extraction
-        style_keywords = {
-            'art_style': ['watercolor', 'digital art', 'oil painting', 'illustration'],
-            'lighting': ['golden hour', 'soft light', 'dramatic lighting', 'moonlight'],
-            'mood': ['whimsical', 'mysterious', 'bright', 'dark', 'cheerful'],
-            'color_palette': ['warm colors', 'cool colors', 'pastel', 'vibrant']
-        }
-        
+        # Simple keyword-based style extraction; a few C-level substring checks
+        # beat a combined regex scan for this many keywords
         extracted_style = {}
         description_lower = description.lower()
         
-        for category, keywords in style_keywords.items():
+        for category, keywords in self.STYLE_KEYWORDS.items():
             for keyword in keywords:
                 if keyword in description_lower:
                     extracted_style[category] = keyword
@@ -439,9 +821,10 @@ class ImageGenerator:
         """Apply style consistency to a scene description."""
         # Add style consistency elements
         consistency_elements = []
+        description_lower = description.lower()
         
         for category, style_element in base_style.items():
-            if style_element not in description.lower():
+            if style_element not in description_lower:
                 consistency_elements.append(style_element)
         
         if consistency_elements:
@@ -452,31 +835,24 @@ class ImageGenerator:
     
     def get_generation_stats(self) -> Dict[str, Any]:
         """Get image generation statistics."""
-        stats = self.stats.copy()
-        if stats['total_generated'] > 0:
-            stats['success_rate'] = stats['successful_generations'] / stats['total_generated']
-        else:
-            stats['success_rate'] = 0
-        
-        return stats
+        total = self.stats['total_generated']
+        success_rate = self.stats['successful_generations'] / total if total > 0 else 0
+        return {**self.stats, 'success_rate': success_rate}
     
     async def health_check(self) -> Dict[str, Any]:
         """Check health of image generation providers."""
-        health_status = {}
-        
-        test_prompt = "A simple test image of a red apple on a white background"
-        
-        for provider_name, provider in self.providers.items():
-            try:
-                result = await provider.generate_image(test_prompt, 1)
-                health_status[provider_name] = {
-                    'status': 'healthy' if result['success'] else 'unhealthy',
-                    'error': result.get('error', None)
-                }
-            except Exception as e:
-                health_status[provider_name] = {
-                    'status': 'unhealthy',
-                    'error': str(e)
-                }
-        
-        return health_status
+        # Cheap authenticated probes rather than paid test generations, run concurrently
+        names = list(self.providers)
+        results = await asyncio.gather(
+            *(provider.health_probe() for provider in self.providers.values()),
+            return_exceptions=True
+        )
+        
+        return {
+            name: {'status': 'unhealthy', 'error': str(result)}
+            if isinstance(result, Exception) else {
+                'status': 'healthy' if result['success'] else 'unhealthy',
+                'error': result.get('error', None)
+            }
+            for name, result in zip(names, results)
+        }